@@ -9,6 +9,7 @@ KEY SETTINGS:
 - fo4_path: Path to Fallout 4 installation root
 - backup_dir: Path to backup directory for extracted BA2s
 - log_file: Path to operation log file
+- parallel_scan: Walk MO2 mod folders on several threads (turn off for spinning disks)
 
 FILE LOCATION:
 - ba2_manager_config.json (created in working directory on first run)
@@ -56,7 +57,8 @@ class Config:
         "fo4_path": "",                # User finds Fallout4.exe
         "log_file": "ba2-manager.log",  # Can use default
         "backup_dir": "",              # Auto-derived from MO2 root
-        "debug_logging": False
+        "debug_logging": False,
+        "parallel_scan": True           # Walk mod folders on several threads (off for spinning disks)
     }
     
     def __init__(self, config_file: str = CONFIG_FILE):
@@ -32,18 +32,81 @@ KEY CONCEPTS:
 """
 
 import os
-import re
+import sys
+import errno
 import subprocess
 import logging
 import shutil
 import json
+import locale
+import hashlib
+from collections import Counter
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Iterable, Iterator
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
-@dataclass
+# Hide the Archive2.exe console window (flag only exists on Windows)
+_CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Plugin file extensions (lowercase), matched against lowercased filenames
+_PLUGIN_EXTENSIONS = (".esl", ".esm", ".esp")
+_PLUGIN_EXTENSIONS_BYTES = tuple(ext.encode() for ext in _PLUGIN_EXTENSIONS)
+
+# BA2 filename tests, matched against lowercased names. Texture archives contain
+# " - texture" (e.g. " - Textures.ba2", " - Textures1.ba2"). Extension checks
+# lowercase only the last four characters (name[-4:]) rather than the whole name.
+_BA2_SUFFIX = ".ba2"
+_TEXTURE_MARKER = " - texture"
+
+
+def _scandir_recursive(path):
+    """Yield an os.DirEntry for every file and directory below path.
+    
+    Directory entries carry their type (and on Windows their size) from the
+    listing itself, so walking this way avoids the Path objects and stat calls
+    of Path.rglob. Like rglob, symlinked directories are not followed and
+    unreadable directories are skipped.
+    """
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    yield entry
+        except OSError:
+            continue
+
+
+def _stat_key(path) -> Optional[tuple]:
+    """(mtime_ns, size) of path for cache keys, or None if it can't be stat'ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _iter_file_sizes(path):
+    """Yield (path string, size) for every file below path.
+    
+    Sizes come from DirEntry.stat(), which for a regular file reuses the
+    listing's lstat result (no stat call at all on Windows), instead of one
+    Path.stat() per file on top of an rglob walk.
+    """
+    for entry in _scandir_recursive(path):
+        try:
+            if entry.is_file():
+                yield entry.path, entry.stat().st_size
+        except OSError:
+            continue
+
+
+@dataclass(slots=True)
 class BA2Info:
     """
     Data structure representing a single mod with its BA2 files.
@@ -59,6 +122,7 @@ class BA2Info:
         nexus_url: Optional URL to the mod's Nexus page
     
     Used by list_ba2_mods() to return mod BA2 information to the GUI.
+    Slotted (no per-instance __dict__), as one is created per listed mod.
     """
     mod_name: str
     has_main_ba2: bool = False
@@ -90,186 +154,214 @@ class BA2Handler:
     
     CONSTANTS:
     - CC_NAMES: Mapping of CC plugin IDs to display names
+    - CC_BA2_COUNT: BA2 archives per CC package (main + textures)
     - VANILLA_BA2S: List of official Fallout 4 base game BA2 filenames
+    - MAX_EXTRACT_WORKERS: Archive2.exe processes run at once when extracting a mod
+    - MAX_COPY_WORKERS: BA2 files copied at once when restoring from backup
+    - PIPELINED_COPY_MIN_SIZE: Files at least this large are copied with overlapped read/write
+    - MAX_SCAN_WORKERS: Top-level mod folders walked at once when scanning the mods directory
     """
     
+    # Each BA2 is extracted by its own Archive2.exe process, so the archives of
+    # one mod can be extracted concurrently (bounded to keep disk I/O sane)
+    MAX_EXTRACT_WORKERS = 4
+    MAX_COPY_WORKERS = 4
+    PIPELINED_COPY_MIN_SIZE = 64 * 1024 * 1024
+    # os.scandir/stat release the GIL, so mod folders can be walked in parallel;
+    # disabled with the "parallel_scan" config setting (e.g. for spinning disks)
+    MAX_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+    
     # CREATION CLUB MAPPING
-    # Maps Creation Club plugin IDs to their display names and BA2 count
+    # Maps Creation Club plugin IDs to their display names
     # Used to identify and categorize CC content in base game Data folder
+    # Every package ships CC_BA2_COUNT archives (main + textures)
+    CC_BA2_COUNT = 2
     CC_NAMES = {
-        "ccacxfo4001": {"name": "Vault Suit Customization", "ba2_count": 2},
-        "ccawnfo4001": {"name": "Graphic T-Shirt Pack", "ba2_count": 2},
-        "ccawnfo4002": {"name": "Faction Clothing Pack", "ba2_count": 2},
-        "ccbgsfo4001": {"name": "Pip-Boy Paint - Black", "ba2_count": 2},
-        "ccbgsfo4002": {"name": "Pip-Boy Paint - Blue", "ba2_count": 2},
-        "ccbgsfo4003": {"name": "Pip-Boy Paint - Desert Camo", "ba2_count": 2},
-        "ccbgsfo4004": {"name": "Pip-Boy Paint - Swamp Camo", "ba2_count": 2},
-        "ccbgsfo4005": {"name": "Pip-Boy Paint - Aquatic Camo", "ba2_count": 2},
-        "ccbgsfo4006": {"name": "Pip-Boy Paint - Chrome", "ba2_count": 2},
-        "ccbgsfo4008": {"name": "Pip-Boy Paint - Green", "ba2_count": 2},
-        "ccbgsfo4009": {"name": "Pip-Boy Paint - Orange", "ba2_count": 2},
-        "ccbgsfo4010": {"name": "Pip-Boy Paint - Pink", "ba2_count": 2},
-        "ccbgsfo4011": {"name": "Pip-Boy Paint - Purple", "ba2_count": 2},
-        "ccbgsfo4012": {"name": "Pip-Boy Paint - Red", "ba2_count": 2},
-        "ccbgsfo4013": {"name": "Pip-Boy Paint - Tan", "ba2_count": 2},
-        "ccbgsfo4014": {"name": "Pip-Boy Paint - Silver White", "ba2_count": 2},
-        "ccbgsfo4015": {"name": "Pip-Boy Paint - Yellow", "ba2_count": 2},
-        "ccbgsfo4016": {"name": "Pip-Boy Paint - Prey (Corvega)", "ba2_count": 2},
-        "ccbgsfo4018": {"name": "Prototype Gauss Rifle", "ba2_count": 2},
-        "ccbgsfo4019": {"name": "Chinese Stealth Armor", "ba2_count": 2},
-        "ccbgsfo4020": {"name": "Power Armor Paint - Onyx", "ba2_count": 2},
-        "ccbgsfo4021": {"name": "Power Armor Paint - Blue", "ba2_count": 2},
-        "ccbgsfo4022": {"name": "Power Armor Paint - Desert Camo", "ba2_count": 2},
-        "ccbgsfo4023": {"name": "Power Armor Paint - Swamp Camo", "ba2_count": 2},
-        "ccbgsfo4024": {"name": "Power Armor Paint - Aquatic Camo", "ba2_count": 2},
-        "ccbgsfo4025": {"name": "Power Armor Paint - Chrome", "ba2_count": 2},
-        "ccbgsfo4027": {"name": "Power Armor Paint - Green", "ba2_count": 2},
-        "ccbgsfo4028": {"name": "Power Armor Paint - Orange", "ba2_count": 2},
-        "ccbgsfo4029": {"name": "Power Armor Paint - Pink", "ba2_count": 2},
-        "ccbgsfo4030": {"name": "Power Armor Paint - Purple", "ba2_count": 2},
-        "ccbgsfo4031": {"name": "Power Armor Paint - Red", "ba2_count": 2},
-        "ccbgsfo4032": {"name": "Power Armor Paint - Tan", "ba2_count": 2},
-        "ccbgsfo4033": {"name": "Power Armor Paint - White", "ba2_count": 2},
-        "ccbgsfo4034": {"name": "Power Armor Paint - Yellow", "ba2_count": 2},
-        "ccbgsfo4035": {"name": "Pint-Sized Slasher", "ba2_count": 2},
-        "ccbgsfo4036": {"name": "TransDOGrifier", "ba2_count": 2},
-        "ccbgsfo4038": {"name": "Horse Power Armor", "ba2_count": 2},
-        "ccbgsfo4040": {"name": "Virtual Workshops", "ba2_count": 2},
-        "ccbgsfo4041": {"name": "Doom Classic Marine Armor", "ba2_count": 2},
-        "ccbgsfo4042": {"name": "Doom BFG", "ba2_count": 2},
-        "ccbgsfo4044": {"name": "Hellfire Power Armor", "ba2_count": 2},
-        "ccbgsfo4045": {"name": "Arcade Workshop Pack", "ba2_count": 2},
-        "ccbgsfo4046": {"name": "Tesla Cannon", "ba2_count": 2},
-        "ccbgsfo4047": {"name": "Quake Thunderbolt", "ba2_count": 2},
-        "ccbgsfo4048": {"name": "Fantasy Hero Set", "ba2_count": 2},
-        "ccbgsfo4049": {"name": "Brahmin Armor", "ba2_count": 2},
-        "ccbgsfo4050": {"name": "Dog Skin - Border Collie", "ba2_count": 2},
-        "ccbgsfo4051": {"name": "Dog Skin - Boxer", "ba2_count": 2},
-        "ccbgsfo4052": {"name": "Dog Skin - Dalmatian", "ba2_count": 2},
-        "ccbgsfo4053": {"name": "Dog Skin - Golden Retriever", "ba2_count": 2},
-        "ccbgsfo4054": {"name": "Dog Skin - Great Dane", "ba2_count": 2},
-        "ccbgsfo4055": {"name": "Dog Skin - Husky", "ba2_count": 2},
-        "ccbgsfo4056": {"name": "Dog Skin - Black Labrador", "ba2_count": 2},
-        "ccbgsfo4057": {"name": "Dog Skin - Yellow Labrador", "ba2_count": 2},
-        "ccbgsfo4058": {"name": "Dog Skin - Chocolate Labrador", "ba2_count": 2},
-        "ccbgsfo4059": {"name": "Dog Skin - Pitbull", "ba2_count": 2},
-        "ccbgsfo4060": {"name": "Dog Skin - Rottweiler", "ba2_count": 2},
-        "ccbgsfo4061": {"name": "Dog Skin - Shiba Inu", "ba2_count": 2},
-        "ccbgsfo4062": {"name": "Pip-Boy Paint - Patriotic", "ba2_count": 2},
-        "ccbgsfo4063": {"name": "Power Armor Paint - Patriotic", "ba2_count": 2},
-        "ccbgsfo4070": {"name": "Pip-Boy Paint - Abraxo", "ba2_count": 2},
-        "ccbgsfo4071": {"name": "Pip-Boy Paint - ArcJet", "ba2_count": 2},
-        "ccbgsfo4072": {"name": "Pip-Boy Paint - Grognak", "ba2_count": 2},
-        "ccbgsfo4073": {"name": "Pip-Boy Paint - Manta Man", "ba2_count": 2},
-        "ccbgsfo4074": {"name": "Pip-Boy Paint - The Inspector", "ba2_count": 2},
-        "ccbgsfo4075": {"name": "Pip-Boy Paint - Silver Shroud", "ba2_count": 2},
-        "ccbgsfo4076": {"name": "Pip-Boy Paint - Mistress of Mystery", "ba2_count": 2},
-        "ccbgsfo4077": {"name": "Pip-Boy Paint - Red Rocket", "ba2_count": 2},
-        "ccbgsfo4078": {"name": "Pip-Boy Paint - Reilly's Rangers", "ba2_count": 2},
-        "ccbgsfo4079": {"name": "Pip-Boy Paint - Vim!", "ba2_count": 2},
-        "ccbgsfo4080": {"name": "Pip-Boy Paint - Pop", "ba2_count": 2},
-        "ccbgsfo4081": {"name": "Pip-Boy Paint - Phenol Resin", "ba2_count": 2},
-        "ccbgsfo4082": {"name": "Pip-Boy Paint - Five-Star Red", "ba2_count": 2},
-        "ccbgsfo4083": {"name": "Pip-Boy Paint - Art Deco", "ba2_count": 2},
-        "ccbgsfo4084": {"name": "Pip-Boy Paint - Adventure", "ba2_count": 2},
-        "ccbgsfo4085": {"name": "Pip-Boy Paint - Hawaii", "ba2_count": 2},
-        "ccbgsfo4086": {"name": "Pip-Boy Paint - Corvega", "ba2_count": 2},
-        "ccbgsfo4087": {"name": "Pip-Boy Paint - Haida", "ba2_count": 2},
-        "ccbgsfo4089": {"name": "Pip-Boy Paint - Neon Sunrise", "ba2_count": 2},
-        "ccbgsfo4090": {"name": "Pip-Boy Paint - Tribal", "ba2_count": 2},
-        "ccbgsfo4091": {"name": "Armor Skin - Bats", "ba2_count": 2},
-        "ccbgsfo4092": {"name": "Armor Skin - Aquatic Camo", "ba2_count": 2},
-        "ccbgsfo4093": {"name": "Armor Skin - Swamp Camo", "ba2_count": 2},
-        "ccbgsfo4094": {"name": "Armor Skin - Desert Camo", "ba2_count": 2},
-        "ccbgsfo4095": {"name": "Armor Skin - Children of Atom", "ba2_count": 2},
-        "ccbgsfo4096": {"name": "Armor Skin - Enclave", "ba2_count": 2},
-        "ccbgsfo4097": {"name": "Armor Skin - Jack O'Lantern", "ba2_count": 2},
-        "ccbgsfo4098": {"name": "Armor Skin - Pickman", "ba2_count": 2},
-        "ccbgsfo4099": {"name": "Armor Skin - Reilly's Rangers", "ba2_count": 2},
-        "ccbgsfo4101": {"name": "Armor Skin - Shi", "ba2_count": 2},
-        "ccbgsfo4103": {"name": "Armor Skin - Tunnel Snakes", "ba2_count": 2},
-        "ccbgsfo4104": {"name": "Weapon Skin - Bats", "ba2_count": 2},
-        "ccbgsfo4105": {"name": "Weapon Skin - Aquatic Camo", "ba2_count": 2},
-        "ccbgsfo4106": {"name": "Weapon Skin - Swamp Camo", "ba2_count": 2},
-        "ccbgsfo4107": {"name": "Weapon Skin - Desert Camo", "ba2_count": 2},
-        "ccbgsfo4108": {"name": "Weapon Skin - Children of Atom", "ba2_count": 2},
-        "ccbgsfo4110": {"name": "Weapon Skin - Enclave", "ba2_count": 2},
-        "ccbgsfo4111": {"name": "Weapon Skin - Jack O'Lantern", "ba2_count": 2},
-        "ccbgsfo4112": {"name": "Weapon Skin - Pickman", "ba2_count": 2},
-        "ccbgsfo4113": {"name": "Weapon Skin - Reilly's Rangers", "ba2_count": 2},
-        "ccbgsfo4114": {"name": "Weapon Skin - Shi", "ba2_count": 2},
-        "ccbgsfo4115": {"name": "X-02 Power Armor", "ba2_count": 2},
-        "ccbgsfo4116": {"name": "Heavy Incinerator", "ba2_count": 2},
-        "ccbgsfo4117": {"name": "Capital Wasteland Mercenaries", "ba2_count": 2},
-        "ccbgsfo4118": {"name": "Weapon Skin - Tunnel Snakes", "ba2_count": 2},
-        "ccbgsfo4119": {"name": "Cyber Dog", "ba2_count": 2},
-        "ccbgsfo4120": {"name": "Power Armor Paint - Pitt Raider", "ba2_count": 2},
-        "ccbgsfo4121": {"name": "Power Armor Paint - Air Force", "ba2_count": 2},
-        "ccbgsfo4122": {"name": "Power Armor Paint - Scorched Sierra", "ba2_count": 2},
-        "ccbgsfo4123": {"name": "Power Armor Paint - Inferno", "ba2_count": 2},
-        "ccbgsfo4124": {"name": "Repurposed Power Armor Helmets", "ba2_count": 2},
-        "cccrsfo4001": {"name": "Pip-Boy Paint - Children of Atom", "ba2_count": 2},
-        "cceejfo4001": {"name": "Home Decor Workshop Pack", "ba2_count": 2},
-        "cceejfo4002": {"name": "Nuka-Cola Collector Workshop", "ba2_count": 2},
-        "ccfrsfo4001": {"name": "Handmade Shotgun", "ba2_count": 2},
-        "ccfrsfo4002": {"name": "Anti-Materiel Rifle", "ba2_count": 2},
-        "ccfrsfo4003": {"name": "CR-74L Combat Rifle", "ba2_count": 2},
-        "ccfsvfo4001": {"name": "Modular Military Backpack", "ba2_count": 2},
-        "ccfsvfo4002": {"name": "Modern Furniture Workshop Pack", "ba2_count": 2},
-        "ccfsvfo4003": {"name": "Coffee and Donuts Workshop Pack", "ba2_count": 2},
-        "ccfsvfo4004": {"name": "Virtual Workshops - GNR Plaza", "ba2_count": 2},
-        "ccfsvfo4005": {"name": "Virtual Workshops - Desert Island", "ba2_count": 2},
-        "ccfsvfo4006": {"name": "Virtual Workshops - Wasteland", "ba2_count": 2},
-        "ccfsvfo4007": {"name": "Halloween Workshop Pack", "ba2_count": 2},
-        "ccgcafo4001": {"name": "Weapon Skin - Army", "ba2_count": 2},
-        "ccgcafo4002": {"name": "Weapon Skin - Atom Cats", "ba2_count": 2},
-        "ccgcafo4003": {"name": "Weapon Skin - Brotherhood of Steel", "ba2_count": 2},
-        "ccgcafo4004": {"name": "Weapon Skin - Gunners", "ba2_count": 2},
-        "ccgcafo4005": {"name": "Weapon Skin - Hot Rod Pink Flames", "ba2_count": 2},
-        "ccgcafo4006": {"name": "Weapon Skin - Hot Rod Shark", "ba2_count": 2},
-        "ccgcafo4007": {"name": "Weapon Skin - Hot Rod Red Flames", "ba2_count": 2},
-        "ccgcafo4008": {"name": "Weapon Skin - The Institute", "ba2_count": 2},
-        "ccgcafo4009": {"name": "Weapon Skin - Minutemen", "ba2_count": 2},
-        "ccgcafo4010": {"name": "Weapon Skin - Railroad", "ba2_count": 2},
-        "ccgcafo4011": {"name": "Weapon Skin - Vault-Tec", "ba2_count": 2},
-        "ccgcafo4012": {"name": "Armor Skin - Atom Cats", "ba2_count": 2},
-        "ccgcafo4013": {"name": "Armor Skin - Brotherhood of Steel", "ba2_count": 2},
-        "ccgcafo4014": {"name": "Armor Skin - Gunners", "ba2_count": 2},
-        "ccgcafo4015": {"name": "Armor Skin - Hot Rod Pink Flames", "ba2_count": 2},
-        "ccgcafo4016": {"name": "Armor Skin - Hot Rod Shark", "ba2_count": 2},
-        "ccgcafo4017": {"name": "Armor Skin - The Institute", "ba2_count": 2},
-        "ccgcafo4018": {"name": "Armor Skin - Minutemen", "ba2_count": 2},
-        "ccgcafo4019": {"name": "Armor Skin - Nuka Cherry", "ba2_count": 2},
-        "ccgcafo4020": {"name": "Armor Skin - Railroad", "ba2_count": 2},
-        "ccgcafo4021": {"name": "Armor Skin - Hot Rod Red Flames", "ba2_count": 2},
-        "ccgcafo4022": {"name": "Armor Skin - Vault-Tec", "ba2_count": 2},
-        "ccgcafo4023": {"name": "Armor Skin - Army", "ba2_count": 2},
-        "ccgcafo4024": {"name": "Institute Plasma Weapons", "ba2_count": 2},
-        "ccgcafo4025": {"name": "Power Armor Paint - Gunners vs. Minutemen", "ba2_count": 2},
-        "ccgrcfo4001": {"name": "Pip-Boy Paint - Grey Tortoise", "ba2_count": 2},
-        "ccgrcfo4002": {"name": "Pip-Boy Paint - Green Vim", "ba2_count": 2},
-        "ccjvdfo4001": {"name": "Holiday Workshop Pack", "ba2_count": 2},
-        "cckgjfo4001": {"name": "Settlement Ambush Kit", "ba2_count": 2},
-        "ccotmfo4001": {"name": "Enclave Remnants", "ba2_count": 2},
-        "ccqdrfo4001": {"name": "Sentinel Control System Companion", "ba2_count": 2},
-        "ccrpsfo4001": {"name": "Sea Scavengers", "ba2_count": 2},
-        "ccrzrfo4001": {"name": "Tunnel Snakes Rule!", "ba2_count": 2},
-        "ccrzrfo4002": {"name": "Zetan Arsenal", "ba2_count": 2},
-        "ccrzrfo4003": {"name": "Pip-Boy Paint - Overseer's Edition", "ba2_count": 2},
-        "ccrzrfo4004": {"name": "Pip-Boy Paint - Institute", "ba2_count": 2},
-        "ccsbjfo4001": {"name": "Solar Cannon", "ba2_count": 2},
-        "ccsbjfo4002": {"name": "Manwell Rifle Set", "ba2_count": 2},
-        "ccsbjfo4003": {"name": "Makeshift Weapon Pack", "ba2_count": 2},
-        "ccsbjfo4004": {"name": "Ion Gun", "ba2_count": 2},
-        "ccswkfo4001": {"name": "Captain Cosmos", "ba2_count": 2},
-        "ccswkfo4002": {"name": "Pip-Boy Paint - Nuka-Cola", "ba2_count": 2},
-        "ccswkfo4003": {"name": "Pip-Boy Paint - Nuka-Cola Quantum", "ba2_count": 2},
-        "cctosfo4001": {"name": "Virtual Workshop: Grid World", "ba2_count": 2},
-        "cctosfo4002": {"name": "Neon Flats", "ba2_count": 2},
-        "ccvltfo4001": {"name": "Noir Penthouse", "ba2_count": 2},
-        "ccygpfo4001": {"name": "Pip-Boy Paint - Cruiser", "ba2_count": 2},
-        "cczsef04001": {"name": "Charlestown Condo", "ba2_count": 2},
-        "cczsefo4002": {"name": "Shroud Manor", "ba2_count": 2},
+        "ccacxfo4001": "Vault Suit Customization",
+        "ccawnfo4001": "Graphic T-Shirt Pack",
+        "ccawnfo4002": "Faction Clothing Pack",
+        "ccbgsfo4001": "Pip-Boy Paint - Black",
+        "ccbgsfo4002": "Pip-Boy Paint - Blue",
+        "ccbgsfo4003": "Pip-Boy Paint - Desert Camo",
+        "ccbgsfo4004": "Pip-Boy Paint - Swamp Camo",
+        "ccbgsfo4005": "Pip-Boy Paint - Aquatic Camo",
+        "ccbgsfo4006": "Pip-Boy Paint - Chrome",
+        "ccbgsfo4008": "Pip-Boy Paint - Green",
+        "ccbgsfo4009": "Pip-Boy Paint - Orange",
+        "ccbgsfo4010": "Pip-Boy Paint - Pink",
+        "ccbgsfo4011": "Pip-Boy Paint - Purple",
+        "ccbgsfo4012": "Pip-Boy Paint - Red",
+        "ccbgsfo4013": "Pip-Boy Paint - Tan",
+        "ccbgsfo4014": "Pip-Boy Paint - Silver White",
+        "ccbgsfo4015": "Pip-Boy Paint - Yellow",
+        "ccbgsfo4016": "Pip-Boy Paint - Prey (Corvega)",
+        "ccbgsfo4018": "Prototype Gauss Rifle",
+        "ccbgsfo4019": "Chinese Stealth Armor",
+        "ccbgsfo4020": "Power Armor Paint - Onyx",
+        "ccbgsfo4021": "Power Armor Paint - Blue",
+        "ccbgsfo4022": "Power Armor Paint - Desert Camo",
+        "ccbgsfo4023": "Power Armor Paint - Swamp Camo",
+        "ccbgsfo4024": "Power Armor Paint - Aquatic Camo",
+        "ccbgsfo4025": "Power Armor Paint - Chrome",
+        "ccbgsfo4027": "Power Armor Paint - Green",
+        "ccbgsfo4028": "Power Armor Paint - Orange",
+        "ccbgsfo4029": "Power Armor Paint - Pink",
+        "ccbgsfo4030": "Power Armor Paint - Purple",
+        "ccbgsfo4031": "Power Armor Paint - Red",
+        "ccbgsfo4032": "Power Armor Paint - Tan",
+        "ccbgsfo4033": "Power Armor Paint - White",
+        "ccbgsfo4034": "Power Armor Paint - Yellow",
+        "ccbgsfo4035": "Pint-Sized Slasher",
+        "ccbgsfo4036": "TransDOGrifier",
+        "ccbgsfo4038": "Horse Power Armor",
+        "ccbgsfo4040": "Virtual Workshops",
+        "ccbgsfo4041": "Doom Classic Marine Armor",
+        "ccbgsfo4042": "Doom BFG",
+        "ccbgsfo4044": "Hellfire Power Armor",
+        "ccbgsfo4045": "Arcade Workshop Pack",
+        "ccbgsfo4046": "Tesla Cannon",
+        "ccbgsfo4047": "Quake Thunderbolt",
+        "ccbgsfo4048": "Fantasy Hero Set",
+        "ccbgsfo4049": "Brahmin Armor",
+        "ccbgsfo4050": "Dog Skin - Border Collie",
+        "ccbgsfo4051": "Dog Skin - Boxer",
+        "ccbgsfo4052": "Dog Skin - Dalmatian",
+        "ccbgsfo4053": "Dog Skin - Golden Retriever",
+        "ccbgsfo4054": "Dog Skin - Great Dane",
+        "ccbgsfo4055": "Dog Skin - Husky",
+        "ccbgsfo4056": "Dog Skin - Black Labrador",
+        "ccbgsfo4057": "Dog Skin - Yellow Labrador",
+        "ccbgsfo4058": "Dog Skin - Chocolate Labrador",
+        "ccbgsfo4059": "Dog Skin - Pitbull",
+        "ccbgsfo4060": "Dog Skin - Rottweiler",
+        "ccbgsfo4061": "Dog Skin - Shiba Inu",
+        "ccbgsfo4062": "Pip-Boy Paint - Patriotic",
+        "ccbgsfo4063": "Power Armor Paint - Patriotic",
+        "ccbgsfo4070": "Pip-Boy Paint - Abraxo",
+        "ccbgsfo4071": "Pip-Boy Paint - ArcJet",
+        "ccbgsfo4072": "Pip-Boy Paint - Grognak",
+        "ccbgsfo4073": "Pip-Boy Paint - Manta Man",
+        "ccbgsfo4074": "Pip-Boy Paint - The Inspector",
+        "ccbgsfo4075": "Pip-Boy Paint - Silver Shroud",
+        "ccbgsfo4076": "Pip-Boy Paint - Mistress of Mystery",
+        "ccbgsfo4077": "Pip-Boy Paint - Red Rocket",
+        "ccbgsfo4078": "Pip-Boy Paint - Reilly's Rangers",
+        "ccbgsfo4079": "Pip-Boy Paint - Vim!",
+        "ccbgsfo4080": "Pip-Boy Paint - Pop",
+        "ccbgsfo4081": "Pip-Boy Paint - Phenol Resin",
+        "ccbgsfo4082": "Pip-Boy Paint - Five-Star Red",
+        "ccbgsfo4083": "Pip-Boy Paint - Art Deco",
+        "ccbgsfo4084": "Pip-Boy Paint - Adventure",
+        "ccbgsfo4085": "Pip-Boy Paint - Hawaii",
+        "ccbgsfo4086": "Pip-Boy Paint - Corvega",
+        "ccbgsfo4087": "Pip-Boy Paint - Haida",
+        "ccbgsfo4089": "Pip-Boy Paint - Neon Sunrise",
+        "ccbgsfo4090": "Pip-Boy Paint - Tribal",
+        "ccbgsfo4091": "Armor Skin - Bats",
+        "ccbgsfo4092": "Armor Skin - Aquatic Camo",
+        "ccbgsfo4093": "Armor Skin - Swamp Camo",
+        "ccbgsfo4094": "Armor Skin - Desert Camo",
+        "ccbgsfo4095": "Armor Skin - Children of Atom",
+        "ccbgsfo4096": "Armor Skin - Enclave",
+        "ccbgsfo4097": "Armor Skin - Jack O'Lantern",
+        "ccbgsfo4098": "Armor Skin - Pickman",
+        "ccbgsfo4099": "Armor Skin - Reilly's Rangers",
+        "ccbgsfo4101": "Armor Skin - Shi",
+        "ccbgsfo4103": "Armor Skin - Tunnel Snakes",
+        "ccbgsfo4104": "Weapon Skin - Bats",
+        "ccbgsfo4105": "Weapon Skin - Aquatic Camo",
+        "ccbgsfo4106": "Weapon Skin - Swamp Camo",
+        "ccbgsfo4107": "Weapon Skin - Desert Camo",
+        "ccbgsfo4108": "Weapon Skin - Children of Atom",
+        "ccbgsfo4110": "Weapon Skin - Enclave",
+        "ccbgsfo4111": "Weapon Skin - Jack O'Lantern",
+        "ccbgsfo4112": "Weapon Skin - Pickman",
+        "ccbgsfo4113": "Weapon Skin - Reilly's Rangers",
+        "ccbgsfo4114": "Weapon Skin - Shi",
+        "ccbgsfo4115": "X-02 Power Armor",
+        "ccbgsfo4116": "Heavy Incinerator",
+        "ccbgsfo4117": "Capital Wasteland Mercenaries",
+        "ccbgsfo4118": "Weapon Skin - Tunnel Snakes",
+        "ccbgsfo4119": "Cyber Dog",
+        "ccbgsfo4120": "Power Armor Paint - Pitt Raider",
+        "ccbgsfo4121": "Power Armor Paint - Air Force",
+        "ccbgsfo4122": "Power Armor Paint - Scorched Sierra",
+        "ccbgsfo4123": "Power Armor Paint - Inferno",
+        "ccbgsfo4124": "Repurposed Power Armor Helmets",
+        "cccrsfo4001": "Pip-Boy Paint - Children of Atom",
+        "cceejfo4001": "Home Decor Workshop Pack",
+        "cceejfo4002": "Nuka-Cola Collector Workshop",
+        "ccfrsfo4001": "Handmade Shotgun",
+        "ccfrsfo4002": "Anti-Materiel Rifle",
+        "ccfrsfo4003": "CR-74L Combat Rifle",
+        "ccfsvfo4001": "Modular Military Backpack",
+        "ccfsvfo4002": "Modern Furniture Workshop Pack",
+        "ccfsvfo4003": "Coffee and Donuts Workshop Pack",
+        "ccfsvfo4004": "Virtual Workshops - GNR Plaza",
+        "ccfsvfo4005": "Virtual Workshops - Desert Island",
+        "ccfsvfo4006": "Virtual Workshops - Wasteland",
+        "ccfsvfo4007": "Halloween Workshop Pack",
+        "ccgcafo4001": "Weapon Skin - Army",
+        "ccgcafo4002": "Weapon Skin - Atom Cats",
+        "ccgcafo4003": "Weapon Skin - Brotherhood of Steel",
+        "ccgcafo4004": "Weapon Skin - Gunners",
+        "ccgcafo4005": "Weapon Skin - Hot Rod Pink Flames",
+        "ccgcafo4006": "Weapon Skin - Hot Rod Shark",
+        "ccgcafo4007": "Weapon Skin - Hot Rod Red Flames",
+        "ccgcafo4008": "Weapon Skin - The Institute",
+        "ccgcafo4009": "Weapon Skin - Minutemen",
+        "ccgcafo4010": "Weapon Skin - Railroad",
+        "ccgcafo4011": "Weapon Skin - Vault-Tec",
+        "ccgcafo4012": "Armor Skin - Atom Cats",
+        "ccgcafo4013": "Armor Skin - Brotherhood of Steel",
+        "ccgcafo4014": "Armor Skin - Gunners",
+        "ccgcafo4015": "Armor Skin - Hot Rod Pink Flames",
+        "ccgcafo4016": "Armor Skin - Hot Rod Shark",
+        "ccgcafo4017": "Armor Skin - The Institute",
+        "ccgcafo4018": "Armor Skin - Minutemen",
+        "ccgcafo4019": "Armor Skin - Nuka Cherry",
+        "ccgcafo4020": "Armor Skin - Railroad",
+        "ccgcafo4021": "Armor Skin - Hot Rod Red Flames",
+        "ccgcafo4022": "Armor Skin - Vault-Tec",
+        "ccgcafo4023": "Armor Skin - Army",
+        "ccgcafo4024": "Institute Plasma Weapons",
+        "ccgcafo4025": "Power Armor Paint - Gunners vs. Minutemen",
+        "ccgrcfo4001": "Pip-Boy Paint - Grey Tortoise",
+        "ccgrcfo4002": "Pip-Boy Paint - Green Vim",
+        "ccjvdfo4001": "Holiday Workshop Pack",
+        "cckgjfo4001": "Settlement Ambush Kit",
+        "ccotmfo4001": "Enclave Remnants",
+        "ccqdrfo4001": "Sentinel Control System Companion",
+        "ccrpsfo4001": "Sea Scavengers",
+        "ccrzrfo4001": "Tunnel Snakes Rule!",
+        "ccrzrfo4002": "Zetan Arsenal",
+        "ccrzrfo4003": "Pip-Boy Paint - Overseer's Edition",
+        "ccrzrfo4004": "Pip-Boy Paint - Institute",
+        "ccsbjfo4001": "Solar Cannon",
+        "ccsbjfo4002": "Manwell Rifle Set",
+        "ccsbjfo4003": "Makeshift Weapon Pack",
+        "ccsbjfo4004": "Ion Gun",
+        "ccswkfo4001": "Captain Cosmos",
+        "ccswkfo4002": "Pip-Boy Paint - Nuka-Cola",
+        "ccswkfo4003": "Pip-Boy Paint - Nuka-Cola Quantum",
+        "cctosfo4001": "Virtual Workshop: Grid World",
+        "cctosfo4002": "Neon Flats",
+        "ccvltfo4001": "Noir Penthouse",
+        "ccygpfo4001": "Pip-Boy Paint - Cruiser",
+        "cczsef04001": "Charlestown Condo",
+        "cczsefo4002": "Shroud Manor",
+    }
+    
+    # Distinct CC_NAMES key lengths (longest first)
+    # Lets get_cc_packages match a plugin like "ccbgsfo4001-pipboy(black)" to its
+    # CC_NAMES key with one dict probe per length instead of scanning every key
+    _CC_KEY_LENGTHS = sorted({len(key) for key in CC_NAMES}, reverse=True)
+    
+    # Base game Data BA2 categories for count_ba2_files, keyed on the first three
+    # characters of the lowercased name: (full name prefix, count category)
+    _DATA_BA2_PREFIXES = {
+        "dlc": ("dlc", "dlc"),
+        "fal": ("fallout4 - ", "main"),
     }
     
     # VANILLA BA2S - Official Fallout 4 base game files
@@ -311,6 +403,30 @@ class BA2Handler:
         "DLCworkshop03 - Textures.ba2",
     ]
     
+    # Lowercased VANILLA_BA2S, hashed once at class load; __init__ uses it as is
+    # and count_ba2_files extends a copy instead of re-lowering the list every call
+    _VANILLA_BA2_NAMES = frozenset(name.lower() for name in VANILLA_BA2S)
+    
+    @property
+    def archive2_path(self) -> Optional[str]:
+        """Path to Archive2.exe (None if not configured)."""
+        return self._archive2_path
+    
+    @archive2_path.setter
+    def archive2_path(self, value: Optional[str]) -> None:
+        self._archive2_path = value
+        # Re-check the new path on next use
+        self._archive2_ok = None
+    
+    def _archive2_available(self) -> bool:
+        """Check once per configured path that Archive2.exe exists.
+        
+        Saves a stat per extraction/merge call; assigning archive2_path resets it.
+        """
+        if self._archive2_ok is None:
+            self._archive2_ok = bool(self._archive2_path) and os.path.isfile(self._archive2_path)
+        return self._archive2_ok
+    
     def __init__(self, archive2_path: Optional[str] = None, mo2_dir: Optional[str] = None, backup_dir: Optional[str] = None, log_file: Optional[str] = None):
         r"""
         Initialize BA2 handler with paths and logging.
@@ -329,62 +445,71 @@ class BA2Handler:
             self.backup_dir = backup_dir
         else:
             # Default: Create backup directory as sibling to mods directory
-            mo2_path = Path(self.mo2_dir)
-            if mo2_path.name == "mods" and mo2_path.parent.exists():
-                # mo2_dir is the mods folder, use parent (MO2 root)
-                self.backup_dir = str(mo2_path.parent / "BA2_Manager_Backups")
-            else:
-                # mo2_dir is something else, create backup alongside it
-                self.backup_dir = str(mo2_path.parent / "BA2_Manager_Backups")
+            # (in the MO2 root when mo2_dir is the mods folder)
+            mo2_parent = os.path.dirname(os.path.normpath(self.mo2_dir))
+            self.backup_dir = os.path.join(mo2_parent, "BA2_Manager_Backups")
         
         self.log_file = log_file or "ba2-manager.log"
         self.failed_extractions = []
+        # Last parsed Fallout4.ccc: ((path, mtime_ns, size), active plugin frozenset)
+        self._ccc_cache = None
+        # Last parsed modlist.txt/plugins.txt: (file-state key, active mods tuple, lowercased frozenset)
+        self._active_mods_cache = None
+        # (size, blake2b digest) of modlist.txt as backed up by backup_modlist()
+        self._modlist_backup_digest = None
+        # Last count_ba2_files result: (file-state key, result dict); see _count_cache_key()
+        self._count_cache = None
         # Initialize vanilla BA2 names with hardcoded list as fallback
-        self.vanilla_ba2_names = set(name.lower() for name in self.VANILLA_BA2S)
+        # (always a frozenset; count_ba2_files replaces it with defaults + scanned names)
+        self.vanilla_ba2_names = self._VANILLA_BA2_NAMES
         # Initialize mod tracking for partial extraction detection
         # Store in working directory (not temp dir) for persistence when running as executable
         self.modlist_file = Path("ba2_manager_modlist.json")
         self.mod_tracking = self._load_mod_tracking()
+        # Set when an extraction state changes; cleared by _save_mod_tracking()
+        self._tracking_dirty = False
         
         # Setup logging
-        import sys
         self.logger = logging.getLogger("BA2Handler")
         # Set log level based on config
         debug_logging = False
+        self.parallel_scan = True
         try:
             from ba2_manager.config import Config
             config = Config()
             debug_logging = config.get("debug_logging", False)
+            self.parallel_scan = config.get("parallel_scan", True)
         except Exception:
             pass
         self.logger.setLevel(logging.DEBUG if debug_logging else logging.INFO)
-        # Remove any existing handlers to avoid duplicates
-        self.logger.handlers.clear()
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        # Always log to working directory
-        try:
-            handler1 = logging.FileHandler("ba2-manager.log", mode='a')
-            handler1.setLevel(logging.DEBUG if debug_logging else logging.INFO)
-            handler1.setFormatter(formatter)
-            self.logger.addHandler(handler1)
-        except Exception as e:
-            print(f"Warning: Could not set up logging to ba2-manager.log: {e}")
-        # Always log to /dist/ba2-manager.log
-        try:
-            handler2 = logging.FileHandler("dist/ba2-manager.log", mode='a')
-            handler2.setLevel(logging.DEBUG if debug_logging else logging.INFO)
-            handler2.setFormatter(formatter)
-            self.logger.addHandler(handler2)
-        except Exception as e:
-            print(f"Warning: Could not set up logging to dist/ba2-manager.log: {e}")
-        # Always log to console
-        try:
-            console_handler = logging.StreamHandler(sys.stdout)
-            console_handler.setLevel(logging.DEBUG if debug_logging else logging.INFO)
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
-        except Exception as e:
-            print(f"Warning: Could not set up console logging: {e}")
+        # Handlers are attached once per process and reused by later BA2Handler
+        # instances (the GUI creates one per operation), so the log files aren't
+        # reopened every time. Handlers carry no level of their own; the logger
+        # level set above does the filtering, so a changed debug setting applies.
+        if not self.logger.handlers:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            # Always log to working directory
+            try:
+                handler1 = logging.FileHandler("ba2-manager.log", mode='a')
+                handler1.setFormatter(formatter)
+                self.logger.addHandler(handler1)
+            except Exception as e:
+                print(f"Warning: Could not set up logging to ba2-manager.log: {e}")
+            # Also log to dist/ba2-manager.log when running from a build tree
+            if os.path.isdir("dist"):
+                try:
+                    handler2 = logging.FileHandler("dist/ba2-manager.log", mode='a')
+                    handler2.setFormatter(formatter)
+                    self.logger.addHandler(handler2)
+                except Exception as e:
+                    print(f"Warning: Could not set up logging to dist/ba2-manager.log: {e}")
+            # Always log to console
+            try:
+                console_handler = logging.StreamHandler(sys.stdout)
+                console_handler.setFormatter(formatter)
+                self.logger.addHandler(console_handler)
+            except Exception as e:
+                print(f"Warning: Could not set up console logging: {e}")
         self.logger.info(f"BA2Handler initialized - mods_dir={self.mo2_dir}, log_file={self.log_file}, debug_logging={debug_logging}")
         
         # Create backups of modlist.txt and plugins.txt on startup
@@ -403,36 +528,61 @@ class BA2Handler:
         return {}
     
     def _save_mod_tracking(self):
-        """Save mod tracking data to ba2_manager_modlist.json file."""
+        """Save mod tracking data to ba2_manager_modlist.json file.
+        
+        Written compactly to a temp file and swapped in with os.replace, so an
+        interrupted save never leaves a truncated tracking file behind.
+        """
         try:
             data = {
                 "version": "1.0",
                 "description": "Tracks BA2 extraction states for mods",
                 "mods": self.mod_tracking
             }
-            with open(self.modlist_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp_file = self.modlist_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_file, self.modlist_file)
+            self._tracking_dirty = False
             self.logger.debug(f"Saved mod tracking to {self.modlist_file}")
         except Exception as e:
             self.logger.warning(f"Could not save mod tracking file: {e}")
     
+    def flush_tracking(self):
+        """Write mod tracking to disk if any extraction state changed since the last save."""
+        if self._tracking_dirty:
+            self._save_mod_tracking()
+    
     def _update_mod_tracking(self, current_mods: dict):
-        """Update tracking with current mod states and clean up uninstalled mods."""
+        """Update tracking with current mod states and clean up uninstalled mods.
+        
+        The tracking file is only rewritten when a mod is newly seen or its
+        extraction state changed; last_seen alone is refreshed in memory and goes
+        out with the next real change.
+        """
         from datetime import datetime
+        now = datetime.now().isoformat()
         
         # Update tracking for mods we currently see
         for mod_name, mod_data in current_mods.items():
-            if mod_name not in self.mod_tracking:
+            main_extracted = mod_data.get('main_extracted', False)
+            texture_extracted = mod_data.get('texture_extracted', False)
+            tracked = self.mod_tracking.get(mod_name)
+            if tracked is None:
                 self.mod_tracking[mod_name] = {
-                    "main_extracted": mod_data.get('main_extracted', False),
-                    "texture_extracted": mod_data.get('texture_extracted', False),
-                    "last_seen": datetime.now().isoformat()
+                    "main_extracted": main_extracted,
+                    "texture_extracted": texture_extracted,
+                    "last_seen": now
                 }
+                self._tracking_dirty = True
             else:
                 # Update extraction states based on current detection
-                self.mod_tracking[mod_name]['main_extracted'] = mod_data.get('main_extracted', False)
-                self.mod_tracking[mod_name]['texture_extracted'] = mod_data.get('texture_extracted', False)
-                self.mod_tracking[mod_name]['last_seen'] = datetime.now().isoformat()
+                if (tracked.get('main_extracted') != main_extracted
+                        or tracked.get('texture_extracted') != texture_extracted):
+                    tracked['main_extracted'] = main_extracted
+                    tracked['texture_extracted'] = texture_extracted
+                    self._tracking_dirty = True
+                tracked['last_seen'] = now
         
         # Detect uninstalled mods by checking if they're in tracking but not in current_mods
         # These might have orphaned backups that should be cleaned up
@@ -441,8 +591,8 @@ class BA2Handler:
             self.logger.info(f"Detected uninstalled mods: {uninstalled_mods}. Orphaned backups may exist.")
             # In future: add cleanup logic here
         
-        # Save updated tracking
-        self._save_mod_tracking()
+        # Save updated tracking (only if something changed)
+        self.flush_tracking()
     
 
     def count_ba2_files(self, fo4_path: str) -> Dict[str, Any]:
@@ -483,7 +633,7 @@ class BA2Handler:
             - base_game: Sum of main + dlc + creation_club + creation_store
             - mods: Count of non-replacement mod BA2s
             - replacements: Count of mod BA2s replacing vanilla files
-            - vanilla_ba2_names: Set of all vanilla BA2 filenames (lowercase)
+            - vanilla_ba2_names: Frozenset of all vanilla BA2 filenames (lowercase)
             - total: base_game + mods + replacements
             - limit: Hard limit of 501 (Fallout 4's safety threshold)
         
@@ -491,25 +641,28 @@ class BA2Handler:
         Each step logs to ba2-manager.log for debugging:
         - Paths being scanned
         - Active CC plugins found
-        - Each BA2 file categorized with explanation
+        - Each BA2 file categorized with explanation (debug logging only)
         - Final counts
         
         TROUBLESHOOTING:
         If counts look wrong, check ba2-manager.log for:
         - "Mods path exists: False" → mo2_dir not configured
         - "Fallout4.ccc not found" → fo4_path incorrect
-        - "0 BA2 files in mods" → Check rglob is working
-        """
-        main_count = 0
-        main_texture_count = 0
-        dlc_count = 0
-        dlc_texture_count = 0
-        cc_count = 0
-        cc_texture_count = 0
-        creation_store_count = 0
-        creation_store_texture_count = 0
-        # Reset to defaults + scanned
-        self.vanilla_ba2_names = set(name.lower() for name in self.VANILLA_BA2S)
+        - "0 BA2 files in mods" → Check the mods folder scan is working
+        """
+        cache_key = self._count_cache_key(fo4_path)
+        if cache_key is not None and self._count_cache is not None and self._count_cache[0] == cache_key:
+            self.logger.debug("BA2 files unchanged since the last count, using cached counts")
+            return dict(self._count_cache[1])
+        # Base game counters, keyed like the returned dict; a texture BA2 counts
+        # under its category key + "_textures"
+        base_counts = dict.fromkeys((
+            "main", "main_textures", "dlc", "dlc_textures",
+            "creation_club", "creation_club_textures",
+            "creation_store", "creation_store_textures",
+        ), 0)
+        # Reset to defaults + scanned (collected here, frozen once the Data scan is done)
+        scanned_vanilla_names = set(self._VANILLA_BA2_NAMES)
         
         # Log debug info
         self.logger.info(f"Counting BA2 files from: {fo4_path}")
@@ -522,53 +675,57 @@ class BA2Handler:
         if fo4_path:
             data_path = Path(fo4_path) / "Data"
             if data_path.exists():
-                for ba2_file in data_path.glob("*.ba2"):
-                    ba2_name = ba2_file.name.lower()
-                    self.vanilla_ba2_names.add(ba2_name)
-                    
-                    # Categorize BA2 files exactly like Fallout 4 requirements
-                    if ba2_name.startswith("cc"):
-                        # For CC BA2s, only count if plugin is active in Fallout4.ccc
-                        ba2_base = ba2_file.stem  # Remove extension
-                        # Handle names like "ccbgsfo4119-cyberdog - main.ba2"
-                        ba2_base = re.sub(r' - (main|textures)$', '', ba2_base, flags=re.IGNORECASE)
+                data_prefixes = self._DATA_BA2_PREFIXES
+                with os.scandir(data_path) as data_entries:
+                    data_ba2_names = (entry.name.lower() for entry in data_entries
+                                      if entry.name[-4:].lower() == _BA2_SUFFIX)
+                    for ba2_name in data_ba2_names:
+                        scanned_vanilla_names.add(ba2_name)
                         
-                        if ba2_base.lower() in active_cc_plugins:
-                            # Distinguish between main and texture CC BA2s
-                            # Texture BA2s contain " - Texture" in the filename
-                            if " - texture" in ba2_name:
-                                cc_texture_count += 1
-                            else:
-                                cc_count += 1
-                    elif ba2_name.startswith("dlc"):
-                        # Distinguish between main and texture DLC BA2s
-                        # Texture BA2s contain " - Texture" in the filename
-                        if " - texture" in ba2_name:
-                            dlc_texture_count += 1
+                        # Categorize BA2 files exactly like Fallout 4 requirements
+                        if ba2_name[:2] == "cc":
+                            # For CC BA2s, only count if plugin is active in Fallout4.ccc
+                            ba2_base = ba2_name[:-4]  # Remove extension (already lowercase)
+                            # Handle names like "ccbgsfo4119-cyberdog - main.ba2"
+                            if ba2_base.endswith(" - main"):
+                                ba2_base = ba2_base[:-7]
+                            elif ba2_base.endswith(" - textures"):
+                                ba2_base = ba2_base[:-11]
+                        
+                            if ba2_base not in active_cc_plugins:
+                                continue
+                            category = "creation_club"
                         else:
-                            dlc_count += 1
-                    elif ba2_name.startswith("fallout4 - "):
-                        # Distinguish between main and texture Fallout4 BA2s
+                            # DLC / Fallout4 by prefix; anything else is a Creation Store
+                            # mod (encrypted, non-extractable)
+                            prefix_entry = data_prefixes.get(ba2_name[:3])
+                            if prefix_entry and ba2_name.startswith(prefix_entry[0]):
+                                category = prefix_entry[1]
+                            else:
+                                category = "creation_store"
+                        
                         # Texture BA2s contain " - Texture" in the filename
-                        if " - texture" in ba2_name:
-                            main_texture_count += 1
-                        else:
-                            main_count += 1
-                    else:
-                        # Creation Store Mods (encrypted, non-extractable)
-                        # Distinguish between main and texture Creation Store BA2s
-                        if " - texture" in ba2_name:
-                            creation_store_texture_count += 1
-                        else:
-                            creation_store_count += 1
+                        if _TEXTURE_MARKER in ba2_name:
+                            category += "_textures"
+                        base_counts[category] += 1
+        
+        self.vanilla_ba2_names = frozenset(scanned_vanilla_names)
+        
+        main_count = base_counts["main"]
+        main_texture_count = base_counts["main_textures"]
+        dlc_count = base_counts["dlc"]
+        dlc_texture_count = base_counts["dlc_textures"]
+        cc_count = base_counts["creation_club"]
+        cc_texture_count = base_counts["creation_club_textures"]
+        creation_store_count = base_counts["creation_store"]
+        creation_store_texture_count = base_counts["creation_store_textures"]
         
         # Count mod BA2s (excluding those that replace vanilla BA2s)
         mod_count = 0
         replacement_count = 0
         
         # Get list of active mods from modlist.txt
-        active_mods = self._get_active_mods()
-        active_mods_set = {m.lower() for m in active_mods}
+        active_mods_set = self._get_active_mods_set()
         
         # Count mod BA2s separately for MAIN and TEXTURES
         mod_main_count = 0
@@ -582,55 +739,46 @@ class BA2Handler:
         self.logger.info(f"Mods path exists: {mods_path.exists()}")
         
         if mods_path.exists():
-            mod_ba2s = list(mods_path.rglob("*.ba2"))
-            self.logger.info(f"Found {len(mod_ba2s)} BA2 files in mods")
-            
-            for ba2_file in mod_ba2s:
-                ba2_name = ba2_file.name.lower()
-                
-                # Find the actual mod folder name (first part of relative path from mods directory)
-                try:
-                    relative_path = ba2_file.relative_to(mods_path)
-                    mod_folder_name = relative_path.parts[0].lower()
-                except ValueError:
-                    # File is not under mods_path, skip
-                    continue
-                
-                # Only count BA2s from active mods (if active_mods is not empty, check it; if empty, count all)
-                if active_mods_set and mod_folder_name not in active_mods_set:
-                    self.logger.debug(f"  Skipping BA2 from inactive mod: {ba2_file.relative_to(mods_path)}")
-                    continue
-                
-                self.logger.info(f"  Checking mod BA2: {ba2_file.relative_to(mods_path)}")
-                
-                if ba2_name in self.vanilla_ba2_names:
-                    # Categorize replacement as main or texture
-                    if " - textures" in ba2_name:
-                        replacement_texture_count += 1
-                        self.logger.info(f"    -> Vanilla replacement texture (active)")
-                    else:
-                        replacement_main_count += 1
-                        self.logger.info(f"    -> Vanilla replacement main (active)")
-                    replacement_count += 1
-                else:
-                    # Categorize as MAIN or TEXTURES based on filename pattern
+            # Resolve once so per-file debug messages aren't formatted when DEBUG is off
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            mods_prefix_len = len(os.path.join(str(mods_path), ""))
+            vanilla_names = self.vanilla_ba2_names
+            
+            def mod_ba2_categories():
+                """Stream one category key per mod BA2 as the walk yields it:
+                (replaces a vanilla BA2, is a texture BA2)."""
+                # Only count BA2s from active mods (if active_mods is not empty, only
+                # those folders are walked; if empty, count all)
+                for entry in self._scan_mod_ba2s(mods_path, active_mods_set):
                     # Texture BA2s contain " - Textures" in the filename (e.g., " - Textures.ba2", " - Textures1.ba2")
-                    if " - textures" in ba2_name:
-                        mod_texture_count += 1
-                        self.logger.info(f"    -> Texture BA2 (active)")
-                    else:
-                        # Treat as main/generic BA2
-                        mod_main_count += 1
-                        self.logger.info(f"    -> Main BA2 (active)")
+                    ba2_name = entry.name.lower()
+                    key = (ba2_name in vanilla_names, " - textures" in ba2_name)
+                    if debug_enabled:
+                        self.logger.debug("  Checking mod BA2: %s -> %s%s (active)", entry.path[mods_prefix_len:],
+                                          "Vanilla replacement " if key[0] else "",
+                                          "texture" if key[1] else "main")
+                    yield key
+            
+            # Categorize while walking: only the per-category totals are kept,
+            # never a list of every BA2 in the mods tree
+            categories = Counter(mod_ba2_categories())
+            replacement_texture_count = categories[True, True]
+            replacement_main_count = categories[True, False]
+            replacement_count = replacement_texture_count + replacement_main_count
+            mod_texture_count = categories[False, True]
+            mod_main_count = categories[False, False]
+            active_count = sum(categories.values())
+            self.logger.info(f"Scanned {active_count} BA2 files in active mods: main={mod_main_count}, "
+                             f"textures={mod_texture_count}, vanilla replacements={replacement_count}")
         else:
             self.logger.warning(f"Mods directory does not exist: {mods_path}")
         
         base_game_count = main_count + dlc_count + cc_count + creation_store_count
         base_game_texture_count = main_texture_count + dlc_texture_count + cc_texture_count + creation_store_texture_count
         
-        self.logger.info(f"Count summary: Base={base_game_count} (Main={main_count}, DLC={dlc_count}, CC={cc_count}, CreationStore={creation_store_count}), BaseTex={base_game_texture_count} (MainTex={main_texture_count}, DLCTex={dlc_texture_count}, CCTex={cc_texture_count}, CreationStoreTex={creation_store_texture_count}), ModMain={mod_main_count}, ModTextures={mod_texture_count}")
+        self.logger.info(f"Count summary: Base={base_game_count} (Main={main_count}, DLC={dlc_count}, CC={cc_count}, CreationStore={creation_store_count}), BaseTex={base_game_texture_count} (MainTex={main_texture_count}, DLCTex={dlc_texture_count}, CCTex={cc_texture_count}, CreationStoreTex={creation_store_texture_count}), ModMain={mod_main_count}, ModTextures={mod_texture_count}, Replacements={replacement_count} (Main={replacement_main_count}, Tex={replacement_texture_count})")
         
-        return {
+        result = {
             "main": main_count,
             "main_textures": main_texture_count,
             "dlc": dlc_count,
@@ -652,6 +800,48 @@ class BA2Handler:
             "limit_main": 255,
             "limit_textures": 254
         }
+        if cache_key is not None:
+            self._count_cache = (cache_key, result)
+        return dict(result)
+    
+    def _count_cache_key(self, fo4_path: str) -> Optional[tuple]:
+        """Build the key that decides whether a cached count_ba2_files result is still valid.
+        
+        Covers the Data folder, Fallout4.ccc, the selected profile's modlist.txt
+        and plugins.txt (path as well as stat, so a profile switch is seen even
+        when both profiles' files have the same mtime and size) and the mods
+        folder plus each top-level mod folder (a directory's mtime changes when
+        its direct children change, so installing, removing or repacking a mod
+        shows up). Extraction, restoration and merging also drop the cache
+        explicitly via _invalidate_counts().
+        
+        Returns:
+            Hashable key, or None if the state can't be read (no caching then)
+        """
+        try:
+            fo4_root = Path(fo4_path) if fo4_path else None
+            modlist_path = self._get_modlist_path()
+            plugins_path = self._get_plugins_path()
+            with os.scandir(self.mo2_dir) as entries:
+                mod_folders = frozenset((entry.name, entry.stat().st_mtime_ns)
+                                        for entry in entries if entry.is_dir())
+            return (
+                fo4_path,
+                _stat_key(fo4_root / "Data") if fo4_root else None,
+                _stat_key(fo4_root / "Fallout4.ccc") if fo4_root else None,
+                str(modlist_path),
+                _stat_key(modlist_path),
+                str(plugins_path),
+                _stat_key(plugins_path),
+                _stat_key(self.mo2_dir),
+                mod_folders,
+            )
+        except Exception:
+            return None
+    
+    def _invalidate_counts(self):
+        """Drop the cached count_ba2_files result (call before changing BA2 files)."""
+        self._count_cache = None
     
     def _get_selected_profile(self, mo2_root: Path) -> str:
         """Read selected_profile from ModOrganizer.ini, returns 'Default' if not found or multiple profiles don't exist"""
@@ -734,7 +924,11 @@ class BA2Handler:
             return mo2_root / "profiles" / profile_name / "plugins.txt"
 
     def backup_modlist(self) -> bool:
-        """Create a backup of modlist.txt on startup"""
+        """Create a backup of modlist.txt on startup
+        
+        The file is read once; its size and digest are kept in memory so
+        verify_modlist_integrity() only has to read the live file.
+        """
         try:
             modlist_path = self._get_modlist_path()
             if not modlist_path.exists():
@@ -742,7 +936,10 @@ class BA2Handler:
                 return False
             
             backup_path = modlist_path.with_suffix('.txt.bak')
-            shutil.copy2(modlist_path, backup_path)
+            data = modlist_path.read_bytes()
+            with open(backup_path, 'wb') as f:
+                f.write(data)
+            self._modlist_backup_digest = (len(data), hashlib.blake2b(data, digest_size=16).digest())
             self.logger.info(f"Backed up modlist.txt to {backup_path}")
             return True
         except Exception as e:
@@ -758,7 +955,8 @@ class BA2Handler:
                 return False
             
             backup_path = plugins_path.with_suffix('.txt.bak')
-            shutil.copy2(plugins_path, backup_path)
+            # Content only: nothing reads the backup's timestamps
+            shutil.copyfile(plugins_path, backup_path)
             self.logger.info(f"Backed up plugins.txt to {backup_path}")
             return True
         except Exception as e:
@@ -774,10 +972,16 @@ class BA2Handler:
             if not modlist_path.exists() or not backup_path.exists():
                 return True # Can't verify
                 
-            # Simple size/mtime check or full content check?
-            # Content check is safer
-            import filecmp
-            is_same = filecmp.cmp(modlist_path, backup_path, shallow=False)
+            if self._modlist_backup_digest is not None:
+                # Compare against the size/digest taken at backup time: a size
+                # mismatch needs no read at all, otherwise only the live file is hashed
+                backup_size, backup_digest = self._modlist_backup_digest
+                is_same = (modlist_path.stat().st_size == backup_size
+                           and hashlib.blake2b(modlist_path.read_bytes(), digest_size=16).digest() == backup_digest)
+            else:
+                # Backup written by another instance; full content check
+                import filecmp
+                is_same = filecmp.cmp(modlist_path, backup_path, shallow=False)
             if not is_same:
                 self.logger.warning("modlist.txt has changed since startup!")
             return is_same
@@ -795,6 +999,7 @@ class BA2Handler:
         Returns:
             True if registration succeeded, False otherwise
         """
+        self._active_mods_cache = None
         try:
             # Add to modlist.txt (at the top, so it's Priority 0)
             modlist_path = self._get_modlist_path()
@@ -849,6 +1054,7 @@ class BA2Handler:
         Returns:
             True if unregistration succeeded, False otherwise
         """
+        self._active_mods_cache = None
         try:
             # Remove from modlist.txt
             modlist_path = self._get_modlist_path()
@@ -899,21 +1105,22 @@ class BA2Handler:
             self.logger.debug(f"plugins.txt not found at {plugins_path}, no plugin-based filtering")
             return disabled_mods
         
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         try:
-            with open(plugins_path, 'r', encoding='utf-8', errors='ignore') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    # Disabled plugins are prefixed with *
-                    if line.startswith('*'):
-                        plugin_name = line[1:].strip()
+            # Read as bytes and only decode the lines that are kept
+            with open(plugins_path, 'rb') as f:
+                for raw in f:
+                    # Disabled plugins are prefixed with * (comments and blank
+                    # lines fall out here too)
+                    line = raw.strip()
+                    if line[:1] == b'*':
+                        plugin_name = line[1:].strip().decode('utf-8', errors='ignore')
                         # Extract mod name from plugin by removing extension
                         # Most plugins match their mod folder name (e.g., MyMod.esp -> MyMod/)
                         mod_name = plugin_name.rsplit('.', 1)[0]
                         disabled_mods.add(mod_name)
-                        self.logger.debug(f"Found disabled plugin: {plugin_name} (mod: {mod_name})")
+                        if debug_enabled:
+                            self.logger.debug("Found disabled plugin: %s (mod: %s)", plugin_name, mod_name)
                     
             self.logger.info(f"Found {len(disabled_mods)} mods with disabled plugins in plugins.txt")
         except Exception as e:
@@ -924,6 +1131,9 @@ class BA2Handler:
     def _get_active_mods(self, mo2_root: Optional[Path] = None) -> List[str]:
         """Read active mods from modlist.txt and filter by plugins.txt.
         
+        The parsed result is cached against both files' paths, mtimes and sizes,
+        so count_ba2_files and list_ba2_mods don't re-read them on every refresh.
+        
         Args:
             mo2_root: Optional path to MO2 root directory.
         
@@ -931,38 +1141,66 @@ class BA2Handler:
             List of active mod folder names in MO2 display order (Priority 0 first),
             excluding mods with disabled plugins
         """
-        active_mods = []
+        return list(self._active_mods_entry(mo2_root)[0])
+    
+    def _get_active_mods_set(self, mo2_root: Optional[Path] = None) -> frozenset[str]:
+        """Lowercased active mod names (see _get_active_mods), cached alongside the list."""
+        return self._active_mods_entry(mo2_root)[1]
+    
+    def _active_mods_entry(self, mo2_root: Optional[Path] = None) -> Tuple[tuple, frozenset]:
+        """Return (active mods, lowercased set), re-reading the profile only when it changed."""
         modlist_path = self._get_modlist_path(mo2_root)
+        plugins_path = self._get_plugins_path(mo2_root)
+        
+        cache_key = (str(modlist_path), _stat_key(modlist_path), str(plugins_path), _stat_key(plugins_path))
+        if self._active_mods_cache is not None and self._active_mods_cache[0] == cache_key:
+            return self._active_mods_cache[1:]
+        
+        active_mods = self._read_active_mods(modlist_path, mo2_root)
+        self._active_mods_cache = (cache_key, tuple(active_mods), frozenset(m.lower() for m in active_mods))
+        return self._active_mods_cache[1:]
+    
+    def _read_active_mods(self, modlist_path: Path, mo2_root: Optional[Path] = None) -> List[str]:
+        """Parse modlist.txt and drop mods with disabled plugins (uncached; see _get_active_mods).
+        
+        Args:
+            modlist_path: Path to the profile's modlist.txt
+            mo2_root: Optional path to MO2 root directory.
+        
+        Returns:
+            List of active mod folder names in MO2 display order (Priority 0 first)
+        """
+        active_mods = []
         
         if not modlist_path.exists():
             self.logger.debug(f"modlist.txt not found at {modlist_path}, counting all mods as active")
             return active_mods
         
         try:
-            with open(modlist_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = f.readlines()
-                
+            # Active mods are prefixed with + (MO2 writes entries without leading
+            # whitespace, so comments, blank lines and disabled "-" mods all fall out here).
+            # Read as bytes and only decode the lines that are kept.
+            with open(modlist_path, 'rb') as f:
+                active_mods = [raw[1:].strip().decode('utf-8', errors='ignore') for raw in f if raw.startswith(b'+')]
+
             # modlist.txt is in reverse priority order (Highest priority at top)
             # We want MO2 display order (Priority 0 at top), so we reverse the list
-            for line in reversed(lines):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Active mods are prefixed with +
-                if line.startswith('+'):
-                    mod_name = line[1:].strip()
-                    active_mods.append(mod_name)
-                    
+            active_mods.reverse()
+
             self.logger.info(f"Found {len(active_mods)} active mods in modlist.txt")
             
             # Additional filtering: Remove mods with disabled plugins
             disabled_plugin_mods = self._get_disabled_plugin_mods(mo2_root)
             if disabled_plugin_mods:
-                original_count = len(active_mods)
-                active_mods = [mod for mod in active_mods if mod not in disabled_plugin_mods]
-                filtered_count = original_count - len(active_mods)
-                if filtered_count > 0:
+                # Folder names are case-insensitive on Windows, and plugin names
+                # don't always share their mod folder's casing. Only rebuild the
+                # list when some disabled plugin actually matches an active mod.
+                disabled_cf = {mod.casefold() for mod in disabled_plugin_mods}
+                overlap = disabled_cf.intersection(mod.casefold() for mod in active_mods)
+                if overlap:
+                    original_count = len(active_mods)
+                    active_mods = [mod for mod in active_mods if mod.casefold() not in overlap]
+                    filtered_count = original_count - len(active_mods)
                     self.logger.info(f"Filtered out {filtered_count} mods with disabled plugins")
                     self.logger.info(f"Final active mod count: {len(active_mods)}")
             
@@ -971,36 +1209,164 @@ class BA2Handler:
         
         return active_mods
     
-    def _get_active_cc_plugins(self, fo4_path: str) -> set[str]:
+    def _get_active_cc_plugins(self, fo4_path: str) -> frozenset[str]:
         """Read active CC plugins from Fallout4.ccc
         
+        The parsed result is cached against the file's path, mtime and size, so
+        repeated GUI refreshes don't re-read an unchanged Fallout4.ccc. Enabling or
+        disabling CC content rewrites the file, which invalidates the cache.
+        
         Args:
             fo4_path: Path to Fallout 4 installation
             
         Returns:
-            Set of active CC plugin base names (without extension, lowercased)
+            Frozenset of active CC plugin base names (without extension, lowercased)
         """
         active_cc = set()
         ccc_path = Path(fo4_path) / "Fallout4.ccc"
         
-        if ccc_path.exists():
+        try:
+            ccc_stat = os.stat(ccc_path)
+        except OSError:
+            ccc_stat = None
+        
+        if ccc_stat is not None:
+            cache_key = (str(ccc_path), ccc_stat.st_mtime_ns, ccc_stat.st_size)
+            if self._ccc_cache is not None and self._ccc_cache[0] == cache_key:
+                return self._ccc_cache[1]
             try:
-                with open(ccc_path, 'r') as f:
-                    for line in f:
-                        trimmed = line.strip()
+                with open(ccc_path, 'rb') as f:
+                    for raw in f:
+                        trimmed = raw.strip().lower()
                         # Match CC plugins: cc*.es[lmp] (case-insensitive)
-                        # Allow alphanumeric, hyphens, underscores, and parentheses
-                        if re.match(r'^cc.+(\.es[lmp])$', trimmed, re.IGNORECASE):
-                            # Remove extension and convert to lowercase for consistent matching
-                            plugin_base = re.sub(r'\.[eE][sS][lmp]$', '', trimmed)
-                            plugin_base = plugin_base.lower()
-                            active_cc.add(plugin_base)
-                # Debug: log all active CC plugin names
-                self.logger.debug(f"Active CC plugins from Fallout4.ccc: {sorted(active_cc)}")
+                        if len(trimmed) > 6 and trimmed.startswith(b'cc') and trimmed.endswith(_PLUGIN_EXTENSIONS_BYTES):
+                            # Remove extension; only matching lines are decoded
+                            active_cc.add(trimmed[:-4].decode('utf-8', errors='ignore'))
+                # Debug: log all active CC plugin names (skip the sort when DEBUG is off)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Active CC plugins from Fallout4.ccc: %s", sorted(active_cc))
+                self._ccc_cache = (cache_key, frozenset(active_cc))
+                return self._ccc_cache[1]
             except Exception as e:
                 self.logger.warning(f"Could not read Fallout4.ccc: {e}")
         
-        return active_cc
+        return frozenset(active_cc)
+    
+    def _iter_ba2_entries(self, root: Path) -> Iterator[os.DirEntry]:
+        """Yield a DirEntry for every .ba2 file below root, recursively."""
+        for entry in _scandir_recursive(root):
+            if entry.name[-4:].lower() == _BA2_SUFFIX and not entry.is_dir(follow_symlinks=False):
+                yield entry
+    
+    def _list_ba2_files(self, folder: Path, prefix: str = "") -> List[Path]:
+        """List the .ba2 files directly in folder whose name starts with prefix.
+        
+        One os.scandir pass with plain string tests instead of Path.glob's
+        pattern matching. Both the prefix and the extension are matched
+        case-insensitively (as Windows globbing does), and glob characters in
+        the prefix (e.g. "[" in a mod name) are taken literally.
+        
+        Args:
+            folder: Folder to list (not searched recursively)
+            prefix: Required filename prefix, e.g. "cc"
+            
+        Returns:
+            List of Paths, empty if the folder can't be read
+        """
+        prefix = prefix.lower()
+        ba2_files = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    name_lower = entry.name.lower()
+                    if name_lower[-4:] == _BA2_SUFFIX and name_lower.startswith(prefix) and entry.is_file():
+                        ba2_files.append(Path(entry.path))
+        except OSError:
+            return []
+        return ba2_files
+    
+    def _scan_mod_ba2s(self, mods_path: Path, active_mods_set: Optional[set] = None,
+                       with_stat: bool = False) -> Iterator[os.DirEntry]:
+        """List every BA2 below the MO2 mods folder, walking mod folders in parallel.
+        
+        Each top-level mod folder is one task for a pool of at most MAX_SCAN_WORKERS
+        threads. Inactive mod folders are skipped; with parallel_scan off (or fewer
+        than two folders) the walk is sequential.
+        
+        Args:
+            mods_path: MO2 mods directory
+            active_mods_set: Lowercased active mod names; empty/None scans every mod
+            with_stat: Fetch each entry's stat() on the scan threads
+            
+        Yields:
+            BA2 DirEntry objects in top-level listing order (loose BA2s in the
+            mods folder only when not filtering by active mods)
+        """
+        try:
+            with os.scandir(mods_path) as entries:
+                top_entries = list(entries)
+        except OSError:
+            return
+        
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        mod_folders = []
+        for entry in top_entries:
+            if entry.is_dir(follow_symlinks=False):
+                if active_mods_set and entry.name.lower() not in active_mods_set:
+                    if debug_enabled:
+                        self.logger.debug("  Skipping inactive mod folder: %s", entry.name)
+                    continue
+                mod_folders.append(entry.path)
+            elif not active_mods_set and entry.name[-4:].lower() == _BA2_SUFFIX:
+                yield entry
+        
+        if not self.parallel_scan or len(mod_folders) < 2:
+            for folder in mod_folders:
+                yield from self._iter_ba2_entries(folder)
+            return
+        
+        def walk_folder(folder: str) -> List[os.DirEntry]:
+            folder_entries = list(self._iter_ba2_entries(folder))
+            if with_stat:
+                for entry in folder_entries:
+                    try:
+                        entry.stat()
+                    except OSError:
+                        pass  # Reported by the caller when it reads the size
+            return folder_entries
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_SCAN_WORKERS, len(mod_folders))) as executor:
+            for folder_entries in executor.map(walk_folder, mod_folders):
+                yield from folder_entries
+    
+    def _classify_ba2(self, entries: Iterable[os.DirEntry], ba2_type: str) -> Iterator[os.DirEntry]:
+        """Yield the BA2 entries of one type.
+        
+        Lazy, so a caller can classify while the directory walk is still running.
+        The DirEntry objects are passed through (not converted to Paths) so callers
+        can reuse their cached stat() results.
+        
+        Args:
+            entries: BA2 DirEntry objects (e.g. from _iter_ba2_entries)
+            ba2_type: "main" or "texture"; anything else matches nothing
+        """
+        if ba2_type not in ("main", "texture"):
+            return
+        want_texture = ba2_type == "texture"
+        for entry in entries:
+            if (_TEXTURE_MARKER in entry.name.lower()) == want_texture:
+                yield entry
+    
+    def _iter_cc_plugin_names(self, data_path: Path):
+        """Yield filenames of CC plugins (cc*.esl/esm/esp) in the Data folder.
+        
+        Uses a single directory listing instead of one glob pass per extension.
+        """
+        with os.scandir(data_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name[:2].lower() == "cc" and name[-4:].lower() in _PLUGIN_EXTENSIONS:
+                    yield name
     
     def get_cc_packages(self, fo4_path: str) -> List[tuple]:
         """
@@ -1026,12 +1392,9 @@ class BA2Handler:
         # 2. Scan Data folder for ALL available CC plugins
         data_path = Path(fo4_path) / "Data"
         if data_path.exists():
-            for ext in ["*.esl", "*.esm", "*.esp"]:
-                for f in data_path.glob(ext):
-                    if f.name.lower().startswith("cc"):
-                        # Store just the base name without extension for consistent ID
-                        base_name = re.sub(r'\.es[lmp]$', '', f.name, flags=re.IGNORECASE).lower()
-                        all_cc_plugins.add((base_name, f.name))
+            for name in self._iter_cc_plugin_names(data_path):
+                # Store just the base name without extension for consistent ID
+                all_cc_plugins.add((name[:-4].lower(), name))
         
         # 3. Build package list
         for plugin_base, full_filename in all_cc_plugins:
@@ -1041,12 +1404,13 @@ class BA2Handler:
             display_name = f"{plugin_base} (Unknown)"
             
             if plugin_base in self.CC_NAMES:
-                display_name = self.CC_NAMES[plugin_base]["name"]
+                display_name = self.CC_NAMES[plugin_base]
             else:
                 # Try to find a key that is a prefix of the plugin_base
-                for key in self.CC_NAMES:
-                    if plugin_base.startswith(key):
-                        display_name = self.CC_NAMES[key]["name"]
+                for key_len in self._CC_KEY_LENGTHS:
+                    key = plugin_base[:key_len]
+                    if key in self.CC_NAMES:
+                        display_name = self.CC_NAMES[key]
                         break
             
             # Store full filename as ID so we can write it back to .ccc correctly
@@ -1063,17 +1427,21 @@ class BA2Handler:
             return None
             
         try:
-            # Simple INI parsing
-            content = meta_file.read_text(encoding='utf-8', errors='ignore')
-            
-            # Extract required fields
-            mod_id_match = re.search(r'^modid=(\d+)', content, re.MULTILINE)
-            game_name_match = re.search(r'^gameName=(.+)', content, re.MULTILINE)
+            # Simple INI parsing: one pass over the lines, first usable value of each key wins
+            mod_id = game_name = None
+            for line in meta_file.read_text(encoding='utf-8', errors='ignore').splitlines():
+                if not mod_id and line.startswith('modid='):
+                    # Keep only the leading digits of the value
+                    value = line[6:]
+                    digits = len(value) - len(value.lstrip('0123456789'))
+                    mod_id = value[:digits]
+                elif not game_name and line.startswith('gameName='):
+                    game_name = line[9:]
+                if mod_id and game_name:
+                    break
             
-            if mod_id_match and game_name_match:
-                mod_id = mod_id_match.group(1)
-                game_name = game_name_match.group(1).lower()
-                return f"https://www.nexusmods.com/{game_name}/mods/{mod_id}"
+            if mod_id and game_name:
+                return f"https://www.nexusmods.com/{game_name.lower()}/mods/{mod_id}"
                 
         except Exception as e:
             self.logger.warning(f"Error parsing meta.ini in {mod_path}: {e}")
@@ -1097,27 +1465,47 @@ class BA2Handler:
         mods_path = Path(self.mo2_dir)
         backup_path = Path(self.backup_dir)
         
-        # Get list of active mods from modlist.txt
-        # This list is in MO2 display order (Priority 0 first)
-        active_mods_list = self._get_active_mods()
+        # Active mods from modlist.txt, as a lowercased set for fast lookups
+        # during filtering (cached with the ordered list)
+        active_mods_set = self._get_active_mods_set()
         
-        # Create a set for fast lookups during filtering
-        active_mods_set = {m.lower() for m in active_mods_list}
+        # Folder of each mod as first seen during the scan, used to resolve
+        # per-mod metadata (meta.ini) once the BA2 loop is done
+        mod_dirs = {}
+        
+        # List the backup folders once instead of probing one path per mod
+        backup_dirs = {}
+        if backup_path.exists():
+            try:
+                with os.scandir(backup_path) as entries:
+                    # Backups of inactive mods are never shown, so they're dropped here
+                    backup_dirs = {sys.intern(entry.name): Path(entry.path) for entry in entries
+                                   if entry.is_dir() and (not active_mods_set or entry.name.lower() in active_mods_set)}
+            except OSError as e:
+                self.logger.error(f"Error scanning backup directory: {e}")
         
         # 1. Scan for BA2 files in mods directory
         if mods_path.exists():
             try:
-                for ba2_file in mods_path.rglob("*.ba2"):
+                # The mod is the top-level folder under mods_path, sliced from the
+                # entry path (BA2s in subfolders belong to the same mod)
+                mods_prefix = os.path.join(str(mods_path), "")
+                mods_prefix_len = len(mods_prefix)
+                # Inactive mod folders are pruned by the scan itself
+                for ba2_entry in self._scan_mod_ba2s(mods_path, active_mods_set, with_stat=True):
                     try:
-                        mod_name = ba2_file.parent.name
-                        
-                        # Skip inactive mods
-                        if active_mods_set and mod_name.lower() not in active_mods_set:
-                            # self.logger.debug(f"Skipping BA2 from inactive mod: {mod_name}")
+                        mod_name, sep, _ = ba2_entry.path[mods_prefix_len:].partition(os.sep)
+                        if not sep:
+                            # Loose BA2 directly in the mods folder, not part of a mod
                             continue
+                        # One shared string object per mod name: every BA2 in the mod
+                        # slices out an equal copy, and the interned one makes the
+                        # ba2_mods/backup_dirs lookups below identity hits
+                        mod_name = sys.intern(mod_name)
                         
                         # Skip vanilla replacements (Fallout4-Textures1.ba2, DLCCoast - Textures.ba2, etc.)
-                        if ba2_file.name.lower() in self.vanilla_ba2_names:
+                        name_lower = ba2_entry.name.lower()
+                        if name_lower in self.vanilla_ba2_names:
                             continue
                         
                         # Initialize mod entry if needed
@@ -1128,17 +1516,18 @@ class BA2Handler:
                                 'main_extracted': False,
                                 'texture_extracted': False,
                                 'total_size': 0,
-                                'has_backup': (backup_path / mod_name).exists(),
-                                'nexus_url': self._get_nexus_url(ba2_file.parent)
+                                'has_backup': mod_name in backup_dirs,
+                                'nexus_url': None
                             }
+                            mod_dirs[mod_name] = Path(mods_prefix + mod_name)
                         
                         # Categorize BA2 file
                         # Texture BA2s contain " - Texture" in the filename (e.g., " - Textures.ba2", " - Textures1.ba2")
-                        is_texture = " - texture" in ba2_file.name.lower()
+                        is_texture = _TEXTURE_MARKER in name_lower
                         try:
-                            file_size = ba2_file.stat().st_size
+                            file_size = ba2_entry.stat().st_size
                         except (FileNotFoundError, PermissionError) as e:
-                            self.logger.warning(f"Cannot access {ba2_file.name}: {e}")
+                            self.logger.warning(f"Cannot access {ba2_entry.name}: {e}")
                             continue
                         ba2_mods[mod_name]['total_size'] += file_size
                         
@@ -1148,40 +1537,43 @@ class BA2Handler:
                             ba2_mods[mod_name]['has_main'] = True
                             
                     except Exception as e:
-                        self.logger.warning(f"Error processing BA2 file {ba2_file}: {e}")
+                        self.logger.warning(f"Error processing BA2 file {ba2_entry.path}: {e}")
                         continue
             except Exception as e:
                 self.logger.error(f"Error listing BA2 mods in {self.mo2_dir}: {e}")
         else:
             self.logger.warning(f"MO2 mods directory not found: {self.mo2_dir}")
+        
+        # Resolve Nexus URLs once per mod, outside the per-BA2 loop
+        for mod_name, mod_dir in mod_dirs.items():
+            ba2_mods[mod_name]['nexus_url'] = self._get_nexus_url(mod_dir)
 
         # 2. Check for extracted mods in backup directory
-        if backup_path.exists():
+        if backup_dirs:
             try:
-                for mod_backup in backup_path.iterdir():
-                    if not mod_backup.is_dir():
-                        continue
-                        
-                    mod_name = mod_backup.name
-                    
-                    # Skip inactive mods
-                    if active_mods_set and mod_name.lower() not in active_mods_set:
-                        continue
-                        
+                # Only active mods' backups were kept in backup_dirs
+                for mod_name, mod_backup in backup_dirs.items():
                     try:
-                        # Get all BA2 files in backup once
-                        backup_ba2_files = [f for f in mod_backup.iterdir() if f.name.lower().endswith('.ba2')]
-                        
-                        # Check what types are in backup
-                        main_ba2_in_backup = any(" - texture" not in f.name.lower() for f in backup_ba2_files)
-                        texture_ba2_in_backup = any(" - texture" in f.name.lower() for f in backup_ba2_files)
+                        # Check what types are in backup in one pass, stopping as soon as both are seen
+                        main_ba2_in_backup = texture_ba2_in_backup = False
+                        with os.scandir(mod_backup) as entries:
+                            for entry in entries:
+                                name_lower = entry.name.lower()
+                                if name_lower[-4:] != _BA2_SUFFIX:
+                                    continue
+                                if _TEXTURE_MARKER in name_lower:
+                                    texture_ba2_in_backup = True
+                                else:
+                                    main_ba2_in_backup = True
+                                if main_ba2_in_backup and texture_ba2_in_backup:
+                                    break
                         
                         if not main_ba2_in_backup and not texture_ba2_in_backup:
                             continue
                             
                         # If mod still has BA2 files in live directory, it's partially extracted
                         if mod_name in ba2_mods:
-                            self.logger.info(f"  Partially extracted: {mod_name} (has some BA2s live)")
+                            self.logger.info("  Partially extracted: %s (has some BA2s live)", mod_name)
                             # Mark which types are extracted (in backup but not in live)
                             live_data = ba2_mods[mod_name]
                             
@@ -1200,7 +1592,7 @@ class BA2Handler:
                             continue
                         
                         # This mod has been fully extracted (no BA2s in live directory)
-                        self.logger.info(f"  Fully extracted: {mod_name}")
+                        self.logger.info("  Fully extracted: %s", mod_name)
                         ba2_mods[mod_name] = {
                             'has_main': main_ba2_in_backup,
                             'has_texture': texture_ba2_in_backup,
@@ -1268,18 +1660,13 @@ class BA2Handler:
             
         try:
             # Find all CC plugins
-            cc_plugins = []
-            for ext in ["*.esl", "*.esm", "*.esp"]:
-                for f in data_path.glob(ext):
-                    if f.name.lower().startswith("cc"):
-                        cc_plugins.append(f.name)
+            cc_plugins = list(self._iter_cc_plugin_names(data_path))
             
             # Sort for consistency
             cc_plugins.sort(key=str.lower)
             
             # Write to backup file
-            with open(backup_path, 'w') as f:
-                f.write('\n'.join(cc_plugins))
+            backup_path.write_text('\n'.join(cc_plugins))
                 
             self.logger.info(f"Created CC master backup with {len(cc_plugins)} plugins: {backup_path}")
             return True
@@ -1309,8 +1696,7 @@ class BA2Handler:
             self.create_cc_master_backup(fo4_path)
             
             # Write the Fallout4.ccc file
-            with open(ccc_path, 'w') as f:
-                f.write('\n'.join(enabled_plugins))
+            ccc_path.write_text('\n'.join(enabled_plugins))
                 
             self.logger.info(f"Updated Fallout4.ccc with {len(enabled_plugins)} plugins")
             
@@ -1331,6 +1717,23 @@ class BA2Handler:
         Returns:
             True if successful, False otherwise
         """
+        return self.enable_cc_contents([plugin_base], fo4_path)
+    
+    def enable_cc_contents(self, plugin_bases: List[str], fo4_path: str) -> bool:
+        """
+        Enable several Creation Club plugins with a single read and write of Fallout4.ccc
+        
+        Plugins whose files cannot be found in Data are logged and skipped; the
+        rest are still added. New plugins are appended to Fallout4.ccc; it is
+        left untouched if nothing changed.
+        
+        Args:
+            plugin_bases: Base names of the plugins (e.g., ["ccbgsfo4001-pipboy(black)"])
+            fo4_path: Path to Fallout 4 installation
+            
+        Returns:
+            True if every plugin was found and is now active, False otherwise
+        """
         if not fo4_path:
             self.logger.error("Fallout 4 path not provided")
             return False
@@ -1338,44 +1741,67 @@ class BA2Handler:
         ccc_path = Path(fo4_path) / "Fallout4.ccc"
         data_path = Path(fo4_path) / "Data"
         
-        # 1. Find the correct filename (with extension)
-        plugin_filename = None
-        if data_path.exists():
-            # Try .esl then .esm then .esp
-            for ext in [".esl", ".esm", ".esp", ".ESL", ".ESM", ".ESP"]:
-                candidate = data_path / f"{plugin_base}{ext}"
-                if candidate.exists():
-                    plugin_filename = candidate.name
-                    break
-        
-        if not plugin_filename:
-            self.logger.error(f"Could not find plugin file for {plugin_base} in Data folder")
-            return False
-            
-        # 2. Add to Fallout4.ccc if not present
         try:
-            lines = []
-            if ccc_path.exists():
-                with open(ccc_path, 'r') as f:
-                    lines = [line.strip() for line in f.readlines() if line.strip()]
-            
-            # Check if already present (case-insensitive)
-            if any(line.lower() == plugin_filename.lower() for line in lines):
-                self.logger.info(f"Plugin {plugin_filename} already active")
-                return True
+            # 1. Find the correct filename (with extension) for each plugin
+            # List Data once, keyed by lowercase name, so lookups are case-insensitive
+            # and cost no stat calls
+            data_plugins = {}
+            if data_path.exists():
+                with os.scandir(data_path) as entries:
+                    for entry in entries:
+                        if entry.name[-4:].lower() in _PLUGIN_EXTENSIONS:
+                            data_plugins[entry.name.lower()] = entry.name
+            
+            success = True
+            plugin_filenames = []
+            for plugin_base in plugin_bases:
+                plugin_filename = None
+                base_lower = plugin_base.lower()
+                # Try .esl then .esm then .esp
+                for ext in _PLUGIN_EXTENSIONS:
+                    plugin_filename = data_plugins.get(base_lower + ext)
+                    if plugin_filename:
+                        break
                 
-            # Append new plugin
-            lines.append(plugin_filename)
+                if not plugin_filename:
+                    self.logger.error(f"Could not find plugin file for {plugin_base} in Data folder")
+                    success = False
+                    continue
+                plugin_filenames.append(plugin_filename)
             
-            # Write back
-            with open(ccc_path, 'w') as f:
-                f.write('\n'.join(lines))
+            if not plugin_filenames:
+                return success
                 
-            self.logger.info(f"Enabled CC content: {plugin_filename}")
-            return True
+            # 2. Add to Fallout4.ccc if not present
+            text = ""
+            if ccc_path.exists():
+                text = ccc_path.read_text()
+            
+            # Case-insensitive membership set, kept in step with the additions below
+            lower_set = {line.lower() for line in map(str.strip, text.splitlines()) if line}
+            added = []
+            for plugin_filename in plugin_filenames:
+                if plugin_filename.lower() in lower_set:
+                    self.logger.info(f"Plugin {plugin_filename} already active")
+                    continue
+                lower_set.add(plugin_filename.lower())
+                added.append(plugin_filename)
+            
+            if not added:
+                return success
+            
+            # Append the whole batch in one write instead of rewriting every
+            # existing entry (our writers leave no trailing newline, so add one first)
+            separator = '\n' if text and not text.endswith('\n') else ''
+            with open(ccc_path, 'a') as f:
+                f.write(separator + '\n'.join(added))
+            
+            for plugin_filename in added:
+                self.logger.info(f"Enabled CC content: {plugin_filename}")
+            return success
             
         except Exception as e:
-            self.logger.error(f"Error enabling CC content {plugin_base}: {e}")
+            self.logger.error(f"Error enabling CC content {', '.join(plugin_bases)}: {e}")
             return False
     
     def disable_cc_content(self, plugin_base: str, fo4_path: str) -> bool:
@@ -1400,26 +1826,25 @@ class BA2Handler:
             return True
             
         try:
-            with open(ccc_path, 'r') as f:
-                lines = [line.strip() for line in f.readlines() if line.strip()]
+            lines = [line for line in map(str.strip, ccc_path.read_text().splitlines()) if line]
             
             # Filter out the plugin (case-insensitive match on base name)
             # We match "plugin_base.esl" or "plugin_base.esm" or "plugin_base.esp"
             new_lines = []
             removed = False
+            plugin_base_lower = plugin_base.lower()
             
             for line in lines:
                 # Check if this line matches the plugin_base (ignoring extension)
-                line_base = re.sub(r'\.es[lmp]$', '', line, flags=re.IGNORECASE)
+                line_base = line[:-4] if line[-4:].lower() in _PLUGIN_EXTENSIONS else line
                 
-                if line_base.lower() == plugin_base.lower():
+                if line_base.lower() == plugin_base_lower:
                     removed = True
                     continue
                 new_lines.append(line)
             
             if removed:
-                with open(ccc_path, 'w') as f:
-                    f.write('\n'.join(new_lines))
+                ccc_path.write_text('\n'.join(new_lines))
                 self.logger.info(f"Disabled CC content: {plugin_base}")
             else:
                 self.logger.info(f"CC content {plugin_base} was not active")
@@ -1441,13 +1866,225 @@ class BA2Handler:
         """
         try:
             if os.path.exists(self.log_file):
-                with open(self.log_file, 'r') as f:
-                    all_lines = f.readlines()
-                    return ''.join(all_lines[-lines:])
+                # Read backwards from the end in blocks until the tail holds enough
+                # line breaks, instead of loading the whole log into memory
+                block_size = 64 * 1024
+                with open(self.log_file, 'rb') as f:
+                    pos = f.seek(0, os.SEEK_END)
+                    tail = b''
+                    newlines = 0
+                    while pos > 0 and (lines <= 0 or newlines <= lines):
+                        read_size = min(block_size, pos)
+                        pos -= read_size
+                        f.seek(pos)
+                        block = f.read(read_size)
+                        newlines += block.count(b'\n')
+                        tail = block + tail
+                # Decode as text mode would (the FileHandler writes with the locale encoding)
+                text = tail.decode(locale.getpreferredencoding(False), errors='replace').replace('\r\n', '\n')
+                return ''.join(text.splitlines(keepends=True)[-lines:])
             return "No log file found"
         except Exception as e:
             return f"Error reading log: {str(e)}"
     
+    def _relative_file_set(self, root: Path) -> set:
+        """Relative paths (strings) of all files below root.
+        
+        Paths are cut from the DirEntry path strings by slicing off the root
+        prefix instead of calling Path.relative_to per file.
+        """
+        prefix_len = len(os.fspath(root)) + 1
+        return {entry.path[prefix_len:] for entry in _scandir_recursive(root) if entry.is_file()}
+    
+    def _link_or_copy(self, src: str, dst: str) -> str:
+        """
+        copytree() copy function that hard-links BA2 archives instead of copying them.
+        
+        BA2s are never modified in place (extraction deletes them, restoration copies
+        them back), so a backup can share them with the mod folder at no disk cost.
+        Other files are copied so later writes to the mod can't reach the backup.
+        Falls back to a normal copy when linking fails (different volume, FAT32, ...).
+        """
+        if src[-4:].lower() == _BA2_SUFFIX:
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                pass
+        return shutil.copy2(src, dst)
+    
+    def _fast_copy(self, src: str, dst: str) -> None:
+        """
+        shutil.copy2() replacement for large BA2 copies.
+        
+        On Linux the data is moved with os.copy_file_range, which lets filesystems
+        like Btrfs/XFS reflink the blocks and otherwise copies inside the kernel.
+        If the filesystem doesn't support it, or on other platforms, this falls
+        back to shutil.copyfile (sendfile or a buffered read/write loop).
+        Metadata is copied afterwards as copy2 does.
+        """
+        copied = 0
+        if sys.platform.startswith("linux") and hasattr(os, "copy_file_range"):
+            src_fd = os.open(src, os.O_RDONLY)
+            try:
+                size = os.fstat(src_fd).st_size
+                dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    while copied < size:
+                        try:
+                            written = os.copy_file_range(src_fd, dst_fd, size - copied)
+                        except OSError as e:
+                            # Unsupported here (cross-device, old kernel, FUSE, ...)
+                            if copied == 0 and e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP):
+                                break
+                            raise
+                        if written == 0:
+                            break
+                        copied += written
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+        
+        if copied == 0:
+            if os.path.getsize(src) >= self.PIPELINED_COPY_MIN_SIZE:
+                self._pipelined_copy(src, dst)
+            else:
+                shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+    
+    def _pipelined_copy(self, src: str, dst: str, block_size: int = 8 * 1024 * 1024) -> None:
+        """
+        Copy a large file, reading the next block on a thread while writing the current one.
+        
+        Args:
+            src: Source file path
+            dst: Destination file path
+            block_size: Bytes per read
+        """
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst, \
+                ThreadPoolExecutor(max_workers=1) as reader:
+            pending = reader.submit(fsrc.read, block_size)
+            while True:
+                block = pending.result()
+                if not block:
+                    break
+                pending = reader.submit(fsrc.read, block_size)
+                fdst.write(block)
+    
+    def _unlink_files(self, paths: List[str]) -> None:
+        """
+        Delete a batch of files, grouped by parent directory.
+        
+        Where the platform supports dir_fd (Linux, macOS) each directory is opened
+        once and its files are removed with unlinkat() relative to it, so the full
+        path isn't resolved again for every file. Elsewhere this is a plain
+        os.unlink loop. Errors propagate to the caller as with os.unlink.
+        """
+        if os.unlink not in os.supports_dir_fd:
+            for path in paths:
+                os.unlink(path)
+            return
+        
+        names_by_dir = {}
+        for path in paths:
+            parent, name = os.path.split(path)
+            names_by_dir.setdefault(parent or os.curdir, []).append(name)
+        
+        for parent, names in names_by_dir.items():
+            dir_fd = os.open(parent, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            try:
+                for name in names:
+                    os.unlink(name, dir_fd=dir_fd)
+            finally:
+                os.close(dir_fd)
+    
+    def _fast_rmtree(self, path: Path) -> None:
+        """
+        Delete a directory tree, unlinking each directory's files on a thread pool.
+        Anything left behind is handed to shutil.rmtree, which raises as usual.
+        
+        Args:
+            path: Directory to delete
+        """
+        # Never walk through a symlinked root; shutil.rmtree refuses those
+        if os.path.islink(path):
+            shutil.rmtree(path)
+            return
+        
+        try:
+            files_by_dir = {}
+            dir_paths = [os.fspath(path)]
+            for entry in _scandir_recursive(path):
+                if entry.is_dir(follow_symlinks=False):
+                    dir_paths.append(entry.path)
+                else:
+                    files_by_dir.setdefault(os.path.dirname(entry.path), []).append(entry.path)
+            
+            def unlink_all(file_paths: List[str]) -> None:
+                for file_path in file_paths:
+                    os.unlink(file_path)
+            
+            if files_by_dir:
+                with ThreadPoolExecutor(max_workers=max(1, min(self.MAX_COPY_WORKERS, len(files_by_dir)))) as executor:
+                    for future in [executor.submit(unlink_all, file_paths) for file_paths in files_by_dir.values()]:
+                        future.result()
+            
+            for dir_path in sorted(dir_paths, key=lambda p: p.count(os.sep), reverse=True):
+                os.rmdir(dir_path)
+        except OSError:
+            pass
+        
+        if os.path.lexists(path):
+            shutil.rmtree(path)
+    
+    def _create_mod_backup(self, mod_path: Path, backup_path: Path) -> None:
+        """Back up a mod folder before extraction, hard-linking its BA2s where possible"""
+        # Ensure backup directory parent exists
+        backup_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copytree(mod_path, backup_path, copy_function=self._link_or_copy)
+    
+    def _extract_ba2_files(self, ba2_files: List[str], dest: Path) -> bool:
+        """
+        Extract BA2 files into dest with Archive2.exe.
+        
+        Up to MAX_EXTRACT_WORKERS archives are extracted concurrently. A mod's
+        archives hold disjoint file sets (main vs textures, Textures1/Textures2
+        splits), so extraction order does not affect the result.
+        
+        Args:
+            ba2_files: Paths (strings) of the BA2 files to extract
+            dest: Folder to extract into
+            
+        Returns:
+            True if every BA2 extracted, False on the first failure
+            (archives that haven't started yet are cancelled)
+        """
+        def extract_one(ba2_file: str) -> subprocess.CompletedProcess:
+            # Archive2.exe usage: Archive2.exe <archive_path> -extract=<destination_path>
+            # Pass argv as a list so paths with spaces/quotes need no shell-style quoting
+            cmd = [self.archive2_path, ba2_file, f"-extract={dest}"]
+            return subprocess.run(cmd, capture_output=True, creationflags=_CREATE_NO_WINDOW, timeout=300)
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, min(self.MAX_EXTRACT_WORKERS, len(ba2_files))))
+        try:
+            futures = {}
+            for ba2_file in ba2_files:
+                self.logger.info(f"Extracting {os.path.basename(ba2_file)}...")
+                futures[executor.submit(extract_one, ba2_file)] = ba2_file
+            
+            for future in as_completed(futures):
+                ba2_file = futures[future]
+                result = future.result()
+                if result.returncode != 0:
+                    self.logger.error(f"Failed to extract {os.path.basename(ba2_file)}: {result.stderr.decode()}")
+                    return False
+        finally:
+            # Waits for running extractions; drops queued ones if we bailed out early
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        return True
+
     def extract_mod(self, mod_name: str) -> bool:
         """
         Extract a mod's BA2 files to loose files.
@@ -1463,6 +2100,7 @@ class BA2Handler:
         Returns:
             True if successful, False otherwise
         """
+        self._invalidate_counts()
         mod_path = Path(self.mo2_dir) / mod_name
         backup_path = Path(self.backup_dir) / mod_name
         
@@ -1470,7 +2108,7 @@ class BA2Handler:
             self.logger.error(f"Mod path not found: {mod_path}")
             return False
             
-        if not self.archive2_path or not os.path.exists(self.archive2_path):
+        if not self._archive2_available():
             self.logger.error("Archive2.exe not found")
             return False
             
@@ -1478,48 +2116,33 @@ class BA2Handler:
             # 1. Create Backup (if it doesn't exist, to preserve previous backups)
             if not backup_path.exists():
                 self.logger.info(f"Creating backup for {mod_name}...")
-                # Ensure backup directory parent exists
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copytree(mod_path, backup_path)
+                self._create_mod_backup(mod_path, backup_path)
             else:
                 self.logger.info(f"Backup already exists for {mod_name}, preserving it")
             
             # 2. Create temp directory for atomic extraction
+            # Stage next to the mod (like restore_mod's _temp_ folder) so moving the
+            # extracted files in is a rename on the same volume rather than a second copy.
+            # Fall back to the system temp dir if the mods folder isn't writable.
             import tempfile
-            temp_dir = Path(tempfile.mkdtemp(prefix=f"ba2_extract_{mod_name}_"))
+            try:
+                temp_dir = Path(tempfile.mkdtemp(prefix=f"_temp_extract_{mod_name}_", dir=mod_path.parent))
+            except OSError:
+                temp_dir = Path(tempfile.mkdtemp(prefix=f"ba2_extract_{mod_name}_"))
             self.logger.debug(f"Using temp directory: {temp_dir}")
             
             # 3. Extract BA2s to temp directory first
-            ba2_files = list(mod_path.rglob("*.ba2"))
+            ba2_files = [entry.path for entry in self._iter_ba2_entries(mod_path)]
             if not ba2_files:
                 self.logger.warning(f"No BA2 files found in {mod_name}")
                 temp_dir.rmdir()  # Clean up temp dir
                 return True # Already extracted?
                 
-            extraction_failed = False
-            extracted_ba2s = []
-            
-            for ba2_file in ba2_files:
-                self.logger.info(f"Extracting {ba2_file.name}...")
-                # Extract to temp directory for atomic operation
-                # Archive2 extracts relative to the output folder
-                # If BA2 contains "textures/foo.dds", it will be at "temp_dir/textures/foo.dds"
-                
-                # Archive2.exe usage: Archive2.exe <archive_path> -extract=<destination_path>
-                cmd = f'"{self.archive2_path}" "{ba2_file}" -extract="{temp_dir}"'
-                
-                # Use startupinfo to hide console window
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                
-                result = subprocess.run(cmd, capture_output=True, startupinfo=startupinfo, timeout=300)
-                
-                if result.returncode == 0:
-                    extracted_ba2s.append(ba2_file)
-                else:
-                    self.logger.error(f"Failed to extract {ba2_file.name}: {result.stderr.decode()}")
-                    extraction_failed = True
-                    break
+            # Extract to temp directory for atomic operation
+            # Archive2 extracts relative to the output folder
+            # If BA2 contains "textures/foo.dds", it will be at "temp_dir/textures/foo.dds"
+            extraction_failed = not self._extract_ba2_files(ba2_files, temp_dir)
+            extracted_ba2s = ba2_files
             
             # 4. Handle Failure or Success
             if extraction_failed:
@@ -1532,23 +2155,28 @@ class BA2Handler:
                 # Success - Perform atomic swap
                 self.logger.info("Extraction successful. Performing atomic swap...")
                 
-                # Copy all extracted content from temp to mod folder
+                # Move all extracted content from temp to mod folder: a rename when
+                # both are on the same volume (os.replace also overwrites an existing
+                # file in place on Windows, where shutil.move would copy it instead),
+                # copy + delete only when the temp dir had to go on another volume
                 for item in temp_dir.iterdir():
                     dest = mod_path / item.name
-                    if item.is_dir():
-                        if dest.exists():
-                            shutil.rmtree(dest)
-                        shutil.copytree(item, dest)
-                    else:
-                        shutil.copy2(item, dest)
+                    if item.is_dir() and dest.exists():
+                        shutil.rmtree(dest)
+                    try:
+                        os.replace(item, dest)
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(str(item), str(dest))
                 
                 # Now delete BA2s from mod folder
+                # The backup holds hard links to them, so this only drops a directory entry
                 self.logger.info("Removing BA2 files from mod folder...")
-                for ba2_file in extracted_ba2s:
-                    os.remove(ba2_file)
+                self._unlink_files(extracted_ba2s)
                 
-                # Clean up temp directory
-                shutil.rmtree(temp_dir)
+                # Temp directory is empty now that its contents were moved out
+                temp_dir.rmdir()
                 self.logger.info(f"Extraction complete. Original BA2s backed up to {backup_path}")
                 return True
                 
@@ -1578,6 +2206,7 @@ class BA2Handler:
         Returns:
             True if successful, False otherwise
         """
+        self._invalidate_counts()
         mod_path = Path(self.mo2_dir) / mod_name
         backup_path = Path(self.backup_dir) / mod_name
         
@@ -1592,9 +2221,10 @@ class BA2Handler:
             self.logger.info(f"Restoring {mod_name} from backup...")
             
             # 1. Copy backup to temp location first (safer than delete-then-copy)
+            # BA2s are hard-linked rather than copied, like the backup was made
             if temp_path.exists():
                 shutil.rmtree(temp_path)
-            shutil.copytree(str(backup_path), str(temp_path))
+            shutil.copytree(str(backup_path), str(temp_path), copy_function=self._link_or_copy)
             self.logger.info(f"Copied backup to temporary location")
             
             # 2. Delete current mod folder only after successful copy
@@ -1608,18 +2238,14 @@ class BA2Handler:
             
             # 4. Verify mod folder matches backup before deleting
             # Get all BA2 files in backup
-            backup_ba2s = set()
-            for ba2_file in backup_path.rglob("*.ba2"):
-                backup_ba2s.add(ba2_file.name.lower())
+            backup_ba2s = {entry.name.lower() for entry in self._iter_ba2_entries(backup_path)}
             
             # Get all BA2 files in restored mod folder
-            mod_ba2s = set()
-            for ba2_file in mod_path.rglob("*.ba2"):
-                mod_ba2s.add(ba2_file.name.lower())
+            mod_ba2s = {entry.name.lower() for entry in self._iter_ba2_entries(mod_path)}
             
             # Only delete backup if all BA2s are present
             if backup_ba2s == mod_ba2s:
-                shutil.rmtree(str(backup_path))
+                self._fast_rmtree(backup_path)
                 self.logger.info(f"Deleted backup folder for {mod_name} (fully restored)")
             else:
                 self.logger.warning(f"Backup BA2s don't match restored mod, keeping backup for safety")
@@ -1650,6 +2276,7 @@ class BA2Handler:
         Returns:
             True if successful, False otherwise
         """
+        self._invalidate_counts()
         mod_path = Path(self.mo2_dir) / mod_name
         backup_path = Path(self.backup_dir) / mod_name
         
@@ -1657,22 +2284,13 @@ class BA2Handler:
             self.logger.error(f"Mod path not found: {mod_path}")
             return False
             
-        if not self.archive2_path or not os.path.exists(self.archive2_path):
+        if not self._archive2_available():
             self.logger.error("Archive2.exe not found")
             return False
         
         try:
             # 1. Find BA2 files of the specified type
-            ba2_files = []
-            for ba2_file in mod_path.rglob("*.ba2"):
-                ba2_name = ba2_file.name.lower()
-                # Texture BA2s contain " - texture" in the filename (e.g., " - Textures.ba2", " - Textures1.ba2")
-                is_texture = " - texture" in ba2_name
-                
-                if ba2_type == "texture" and is_texture:
-                    ba2_files.append(ba2_file)
-                elif ba2_type == "main" and not is_texture:
-                    ba2_files.append(ba2_file)
+            ba2_files = [entry.path for entry in self._classify_ba2(self._iter_ba2_entries(mod_path), ba2_type)]
             
             if not ba2_files:
                 self.logger.warning(f"No {ba2_type} BA2 files found in {mod_name}")
@@ -1681,28 +2299,15 @@ class BA2Handler:
             # 2. Create backup if requested and doesn't exist
             if create_backup and not backup_path.exists():
                 self.logger.info(f"Creating backup for {mod_name}...")
-                # Ensure backup directory parent exists
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copytree(mod_path, backup_path)
+                self._create_mod_backup(mod_path, backup_path)
             
             # 3. Extract BA2 files
-            for ba2_file in ba2_files:
-                self.logger.info(f"Extracting {ba2_file.name}...")
-                
-                cmd = f'"{self.archive2_path}" "{ba2_file}" -extract="{mod_path}"'
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                
-                result = subprocess.run(cmd, capture_output=True, startupinfo=startupinfo, timeout=300)
-                
-                if result.returncode != 0:
-                    self.logger.error(f"Failed to extract {ba2_file.name}: {result.stderr.decode()}")
-                    return False
+            if not self._extract_ba2_files(ba2_files, mod_path):
+                return False
             
             # 4. Delete extracted BA2 files
             self.logger.info(f"Removing extracted {ba2_type} BA2 files...")
-            for ba2_file in ba2_files:
-                os.remove(ba2_file)
+            self._unlink_files(ba2_files)
             
             self.logger.info(f"Successfully extracted {ba2_type} BA2 for {mod_name}")
             return True
@@ -1724,6 +2329,7 @@ class BA2Handler:
         Returns:
             True if successful, False otherwise
         """
+        self._invalidate_counts()
         mod_path = Path(self.mo2_dir) / mod_name
         backup_path = Path(self.backup_dir) / mod_name
         
@@ -1734,44 +2340,96 @@ class BA2Handler:
         try:
             self.logger.info(f"Restoring {ba2_type} BA2 for {mod_name} from backup...")
             
-            # Find BA2 files of the specified type in backup
-            ba2_files_to_restore = []
-            for ba2_file in backup_path.rglob("*.ba2"):
-                ba2_name = ba2_file.name.lower()
-                # Texture BA2s contain " - texture" in the filename (e.g., " - Textures.ba2", " - Textures1.ba2")
-                is_texture = " - texture" in ba2_name
-                
-                if ba2_type == "texture" and is_texture:
-                    ba2_files_to_restore.append(ba2_file)
-                elif ba2_type == "main" and not is_texture:
-                    ba2_files_to_restore.append(ba2_file)
-            
-            if not ba2_files_to_restore:
+            # Walk the backup once: the BA2s of the requested type are copied, and
+            # all of them are checked afterwards to see if the restore is complete.
+            # Plain strings from here on: every backup BA2 path starts with backup_str,
+            # so the target is the same path re-rooted under the mod folder
+            backup_str = os.fspath(backup_path)
+            mod_str = os.fspath(mod_path)
+            backup_entries = list(self._iter_ba2_entries(backup_path))
+            copy_pairs = [(backup_entry, mod_str + backup_entry.path[len(backup_str):])
+                          for backup_entry in self._classify_ba2(backup_entries, ba2_type)]
+            
+            if not copy_pairs:
                 self.logger.warning(f"No {ba2_type} BA2 files in backup for {mod_name}")
                 return True
             
             # Copy BA2 files from backup to mod folder (don't delete from backup)
-            for backup_ba2 in ba2_files_to_restore:
-                relative_path = backup_ba2.relative_to(backup_path)
-                target_ba2 = mod_path / relative_path
-                
-                # Create parent directory if needed
-                target_ba2.parent.mkdir(parents=True, exist_ok=True)
+            # Create parent directories up front so the copies can run concurrently
+            for target_dir in {os.path.dirname(target_ba2) for _, target_ba2 in copy_pairs}:
+                os.makedirs(target_dir, exist_ok=True)
+            
+            def copy_one(backup_entry: os.DirEntry, target_ba2: str) -> bool:
+                # Skip BA2s already in place with the same size and mtime (restoring
+                # twice, resuming an interrupted restore, or a hard-linked backup).
+                # The backup side reuses the DirEntry's cached stat.
+                try:
+                    target_stat = os.stat(target_ba2)
+                    backup_stat = backup_entry.stat()
+                    if (target_stat.st_size == backup_stat.st_size
+                            and int(target_stat.st_mtime) == int(backup_stat.st_mtime)):
+                        return False
+                except FileNotFoundError:
+                    pass
                 
-                # Copy file (keep backup intact)
-                shutil.copy2(backup_ba2, target_ba2)
-                self.logger.info(f"Restored {backup_ba2.name}")
+                # Copy file (keep backup intact) under a temp name beside the target, then
+                # rename it into place: an interrupted restore never leaves a truncated BA2,
+                # and replacing the name leaves a hard-linked backup copy untouched
+                temp_ba2 = target_ba2 + ".restore.tmp"
+                try:
+                    self._fast_copy(backup_entry.path, temp_ba2)
+                    os.replace(temp_ba2, target_ba2)
+                except BaseException:
+                    try:
+                        os.unlink(temp_ba2)
+                    except OSError:
+                        pass
+                    raise
+                return True
             
-            # Check if mod folder now matches backup (all BA2s restored)
-            # Get all BA2 files in backup
-            backup_ba2s = set()
-            for ba2_file in backup_path.rglob("*.ba2"):
-                backup_ba2s.add(ba2_file.name.lower())
+            # BA2s are large, so overlapping the copies keeps fast disks busy
+            copy_failed = False
+            restored_names = []
+            skipped_names = []
+            with ThreadPoolExecutor(max_workers=max(1, min(self.MAX_COPY_WORKERS, len(copy_pairs)))) as executor:
+                futures = {executor.submit(copy_one, *pair): pair[0] for pair in copy_pairs}
+                for future in as_completed(futures):
+                    backup_entry = futures[future]
+                    try:
+                        copied = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Failed to restore {backup_entry.name}: {e}")
+                        copy_failed = True
+                        continue
+                    (restored_names if copied else skipped_names).append(backup_entry.name)
             
-            # Get all BA2 files in mod folder
+            # One log record per outcome rather than one per file
+            if restored_names:
+                self.logger.info("Restored: %s", ", ".join(sorted(restored_names)))
+            if skipped_names:
+                self.logger.info("Unchanged, skipped: %s", ", ".join(sorted(skipped_names)))
+            
+            if copy_failed:
+                return False
+            
+            # Check if mod folder now matches backup (all BA2s restored). One walk of
+            # the mod folder collects its BA2 names along with the loose files to
+            # delete and the directories to prune if it does
+            backup_ba2s = {entry.name.lower() for entry in backup_entries}
             mod_ba2s = set()
-            for ba2_file in mod_path.rglob("*.ba2"):
-                mod_ba2s.add(ba2_file.name.lower())
+            loose_files = []
+            sub_dirs = []
+            for entry in _scandir_recursive(mod_path):
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(entry.path)
+                elif entry.is_file():
+                    # Keep BA2s, ESPs, ESMs, and meta.ini
+                    name_lower = entry.name.lower()
+                    extension = os.path.splitext(name_lower)[1]
+                    if extension == _BA2_SUFFIX:
+                        mod_ba2s.add(name_lower)
+                    elif extension not in ('.esp', '.esm') and name_lower != 'meta.ini':
+                        loose_files.append(entry)
             
             # If all BA2s are restored, clean up loose files and delete backup
             if backup_ba2s == mod_ba2s:
@@ -1779,28 +2437,29 @@ class BA2Handler:
                 
                 # Delete all loose files except BA2s, ESPs, and meta.ini
                 files_deleted = 0
-                for item in mod_path.rglob("*"):
-                    if item.is_file():
-                        # Keep BA2s, ESPs, ESMs, and meta.ini
-                        if item.suffix.lower() not in ['.ba2', '.esp', '.esm'] and item.name.lower() != 'meta.ini':
-                            try:
-                                item.unlink()
-                                files_deleted += 1
-                            except Exception as e:
-                                self.logger.warning(f"Failed to delete {item.name}: {e}")
-                
-                # Remove empty directories
-                for item in sorted(mod_path.rglob("*"), key=lambda p: len(p.parts), reverse=True):
-                    if item.is_dir() and not any(item.iterdir()):
-                        try:
-                            item.rmdir()
-                        except Exception as e:
-                            self.logger.warning(f"Failed to remove empty directory {item.name}: {e}")
+                for entry in loose_files:
+                    try:
+                        os.unlink(entry.path)
+                        files_deleted += 1
+                    except Exception as e:
+                        self.logger.warning(f"Failed to delete {entry.name}: {e}")
+                
+                # Remove empty directories, deepest first. The walk lists every directory
+                # before anything inside it, so the reversed list already puts each
+                # directory after all of its subdirectories; no sort by depth is needed
+                for dir_path in reversed(sub_dirs):
+                    try:
+                        with os.scandir(dir_path) as entries:
+                            is_empty = next(entries, None) is None
+                        if is_empty:
+                            os.rmdir(dir_path)
+                    except Exception as e:
+                        self.logger.warning(f"Failed to remove empty directory {os.path.basename(dir_path)}: {e}")
                 
                 self.logger.info(f"Deleted {files_deleted} loose files, mod fully restored to BA2s")
                 
                 # Now safe to delete backup
-                shutil.rmtree(backup_path)
+                self._fast_rmtree(backup_path)
                 self.logger.info(f"Deleted backup folder for {mod_name}")
             else:
                 missing = backup_ba2s - mod_ba2s
@@ -1838,7 +2497,8 @@ class BA2Handler:
                 - mod_folder: path to created MO2 mod folder
                 - error: error message (if failed)
         """
-        if not self.archive2_path or not Path(self.archive2_path).exists():
+        self._invalidate_counts()
+        if not self._archive2_available():
             return {"success": False, "error": "Archive2.exe not found"}
         
         data_path = Path(fo4_path) / "Data"
@@ -1876,9 +2536,7 @@ class BA2Handler:
             self.logger.info("="*60)
             
             # 1. Find all CC BA2 files
-            cc_ba2_files = []
-            for ba2_file in data_path.glob("cc*.ba2"):
-                cc_ba2_files.append(ba2_file)
+            cc_ba2_files = self._list_ba2_files(data_path, "cc")
             
             if not cc_ba2_files:
                 return {"success": False, "error": "No CC BA2 files found to merge"}
@@ -1917,7 +2575,7 @@ class BA2Handler:
             for ba2_idx, ba2_file in enumerate(cc_ba2_files, 1):
                 ba2_name = ba2_file.name.lower()
                 # Check for both singular and plural texture naming
-                is_texture = " - texture" in ba2_name or " - textures" in ba2_name
+                is_texture = _TEXTURE_MARKER in ba2_name
                 
                 if is_texture:
                     texture_ba2s.append(ba2_file)
@@ -1929,7 +2587,7 @@ class BA2Handler:
                     extract_to = general_path
                 
                 # Count files before extraction (for overwrite detection)
-                files_before = set(str(f.relative_to(extract_to)) for f in extract_to.rglob("*") if f.is_file())
+                files_before = self._relative_file_set(extract_to)
                 
                 # Extract BA2 (files merge/overwrite at same level)
                 self.logger.info(f"[{ba2_idx}/{len(cc_ba2_files)}] Extracting {ba2_file.name} to {extract_to.name}/...")
@@ -1940,6 +2598,7 @@ class BA2Handler:
                     [self.archive2_path, str(ba2_file), f"-e={extract_to}"],
                     capture_output=True,
                     text=True,
+                    creationflags=_CREATE_NO_WINDOW,
                     timeout=300
                 )
                 extract_time = time.time() - extract_start
@@ -1948,7 +2607,7 @@ class BA2Handler:
                     raise Exception(f"Failed to extract {ba2_file.name}: {result.stderr}")
                 
                 # Count files after extraction
-                files_after = set(str(f.relative_to(extract_to)) for f in extract_to.rglob("*") if f.is_file())
+                files_after = self._relative_file_set(extract_to)
                 new_files = files_after - files_before
                 overwritten_files = files_before & files_after
                 
@@ -1989,15 +2648,18 @@ class BA2Handler:
             sounds_dir = temp_path / "Sounds"
             sounds_dir.mkdir()
             sound_extensions = {".xwm", ".wav", ".fuz"}
-            has_sounds = False
             
-            for f in general_path.rglob("*"):
-                if f.is_file() and f.suffix.lower() in sound_extensions:
-                    rel = f.relative_to(general_path)
-                    dest = sounds_dir / rel
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(f), str(dest))
-                    has_sounds = True
+            # Relative paths by slicing off the general_path prefix (no relative_to per file)
+            general_prefix_len = len(os.fspath(general_path)) + 1
+            sound_moves = [(f, os.path.join(sounds_dir, os.fspath(f)[general_prefix_len:]))
+                           for f in general_path.rglob("*")
+                           if f.is_file() and f.suffix.lower() in sound_extensions]
+            # Create each destination folder once rather than once per file
+            for dest_dir in {os.path.dirname(dest) for _, dest in sound_moves}:
+                os.makedirs(dest_dir, exist_ok=True)
+            for f, dest in sound_moves:
+                shutil.move(str(f), dest)
+            has_sounds = bool(sound_moves)
             
             if has_sounds:
                 sound_file_count = sum(1 for _ in sounds_dir.rglob("*") if _.is_file())
@@ -2023,19 +2685,18 @@ class BA2Handler:
                 merged_main_path = mod_folder / f"{output_name} - Main.ba2"
                 self.logger.info(f"Creating merged main BA2: {merged_main_path.name}")
                 
-                # Get all files once for counting and size calculation
-                general_files = list(general_path.rglob("*"))
-                general_files = [f for f in general_files if f.is_file()]
+                # Get all files and their sizes in one walk
+                general_files = list(_iter_file_sizes(general_path))
                 general_file_count = len(general_files)
-                uncompressed_size = sum(f.stat().st_size for f in general_files)
+                uncompressed_size = sum(size for _, size in general_files)
                 self.logger.info(f"Packing {general_file_count} files, {uncompressed_size / (1024**2):.2f} MB uncompressed")
                 
                 # Create source file list
                 source_list = temp_path / "general_files.txt"
                 with open(source_list, 'w') as f:
-                    for item in general_files:
+                    for item, _ in general_files:
                         # Write relative path from general_path
-                        rel_path = item.relative_to(general_path)
+                        rel_path = item[general_prefix_len:]
                         f.write(f"{rel_path}\n")
                 
                 import time
@@ -2047,6 +2708,7 @@ class BA2Handler:
                      f"-r={general_path}"],
                     capture_output=True,
                     text=True,
+                    creationflags=_CREATE_NO_WINDOW,
                     timeout=600
                 )
                 pack_time = time.time() - pack_start
@@ -2065,8 +2727,9 @@ class BA2Handler:
             # Pack Sounds BA2 (Uncompressed)
             if has_sounds:
                 merged_sounds_path = mod_folder / f"{output_name} - Sounds.ba2"
-                sound_file_count = sum(1 for _ in sounds_dir.rglob("*") if _.is_file())
-                uncompressed_size = sum(f.stat().st_size for f in sounds_dir.rglob("*") if f.is_file())
+                sound_sizes = [size for _, size in _iter_file_sizes(sounds_dir)]
+                sound_file_count = len(sound_sizes)
+                uncompressed_size = sum(sound_sizes)
                 self.logger.info(f"Creating {merged_sounds_path.name} ({sound_file_count} files, {uncompressed_size / (1024**2):.2f} MB uncompressed)...")
                 
                 import time
@@ -2079,6 +2742,7 @@ class BA2Handler:
                      f"-r={sounds_dir}"],
                     capture_output=True,
                     text=True,
+                    creationflags=_CREATE_NO_WINDOW,
                     timeout=600
                 )
                 pack_time = time.time() - pack_start
@@ -2093,7 +2757,7 @@ class BA2Handler:
             # Pack Textures BA2 (with 3GB split logic)
             if texture_ba2s:
                 # Get all texture files once
-                texture_files = [(item, item.stat().st_size) for item in textures_path.rglob("*") if item.is_file()]
+                texture_files = list(_iter_file_sizes(textures_path))
                 texture_file_count = len(texture_files)
                 
                 # Sort by size (descending) to optimize packing, or keep path order?
@@ -2105,6 +2769,7 @@ class BA2Handler:
                 MAX_BA2_SIZE = 3 * 1024 * 1024 * 1024
                 
                 archive_groups = []
+                group_sizes = []
                 current_group = []
                 current_size = 0
                 
@@ -2113,6 +2778,7 @@ class BA2Handler:
                     # (Only if current group is not empty - single huge file must go somewhere)
                     if current_size + file_size > MAX_BA2_SIZE and current_group:
                         archive_groups.append(current_group)
+                        group_sizes.append(current_size)
                         current_group = []
                         current_size = 0
                     
@@ -2121,6 +2787,7 @@ class BA2Handler:
                 
                 if current_group:
                     archive_groups.append(current_group)
+                    group_sizes.append(current_size)
                 
                 total_uncompressed = sum(size for _, size in texture_files)
                 self.logger.info(f"Total uncompressed texture data: {total_uncompressed / (1024**3):.2f}GB")
@@ -2140,7 +2807,7 @@ class BA2Handler:
                     archive_name = f"{output_name}{suffix} - Textures.ba2"
                     merged_textures_path = mod_folder / archive_name
                     
-                    group_uncompressed = sum(f.stat().st_size for f in file_group)
+                    group_uncompressed = group_sizes[idx]
                     self.logger.info(f"Creating {archive_name} with {len(file_group)} files ({group_uncompressed / (1024**3):.2f}GB uncompressed)...")
                     
                     # Create temp folder for this group
@@ -2149,11 +2816,13 @@ class BA2Handler:
                         shutil.rmtree(split_temp)
                     split_temp.mkdir(exist_ok=True)
                     
-                    # Copy files to temp folder (preserving structure)
-                    for file_path in file_group:
-                        rel_path = file_path.relative_to(textures_path)
-                        dest_path = split_temp / rel_path
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    # Copy files to temp folder (preserving structure), creating each folder once
+                    textures_prefix_len = len(os.fspath(textures_path)) + 1
+                    copy_pairs = [(file_path, os.path.join(split_temp, file_path[textures_prefix_len:]))
+                                  for file_path in file_group]
+                    for dest_dir in {os.path.dirname(dest_path) for _, dest_path in copy_pairs}:
+                        os.makedirs(dest_dir, exist_ok=True)
+                    for file_path, dest_path in copy_pairs:
                         shutil.copy2(file_path, dest_path)
                     
                     pack_start = time.time()
@@ -2164,6 +2833,7 @@ class BA2Handler:
                          f"-r={split_temp}"],
                         capture_output=True,
                         text=True,
+                        creationflags=_CREATE_NO_WINDOW,
                         timeout=600
                     )
                     pack_time = time.time() - pack_start
@@ -2271,7 +2941,8 @@ class BA2Handler:
         Returns:
             Dict with success, merged paths, backup path, etc.
         """
-        if not self.archive2_path or not Path(self.archive2_path).exists():
+        self._invalidate_counts()
+        if not self._archive2_available():
             return {"success": False, "error": "Archive2.exe not found"}
         
         data_path = Path(fo4_path) / "Data"
@@ -2281,7 +2952,7 @@ class BA2Handler:
         # Get BA2 files for selected mods
         all_ba2s = []
         for mod_name in mod_names:
-            ba2_files = list(data_path.glob(f"{mod_name}*.ba2"))
+            ba2_files = self._list_ba2_files(data_path, mod_name)
             if ba2_files:
                 all_ba2s.extend(ba2_files)
         
@@ -2325,13 +2996,12 @@ class BA2Handler:
             # Sort BA2s by load order (lower index = earlier load, will be overwritten by later)
             def get_load_priority(ba2_file):
                 # Extract mod name from BA2 filename by removing BA2 suffix patterns
-                ba2_name = ba2_file.stem  # Get filename without .ba2 extension
+                mod_name = ba2_file.stem.lower()  # Filename without .ba2 extension, lowercased once
                 # Remove common suffixes like " - Main", " - Textures", etc.
                 for suffix in [' - main', ' - textures', ' - texture', '-main', '-textures', '-texture']:
-                    if ba2_name.lower().endswith(suffix):
-                        ba2_name = ba2_name[:-len(suffix)]
+                    if mod_name.endswith(suffix):
+                        mod_name = mod_name[:-len(suffix)]
                         break
-                mod_name = ba2_name.lower()
                 # Return load order index, or high number if not in modlist
                 priority = load_order.get(mod_name, 999999)
                 self.logger.debug(f"BA2 {ba2_file.name} -> mod '{mod_name}' -> priority {priority}")
@@ -2355,8 +3025,13 @@ class BA2Handler:
             self.logger.info(f"Backed up {len(all_ba2s)} BA2 files to {backup_path}")
             
             # Separate into main and texture archives (preserving load order)
-            main_ba2s = [f for f in all_ba2s if 'texture' not in f.name.lower()]
-            texture_ba2s = [f for f in all_ba2s if 'texture' in f.name.lower()]
+            main_ba2s = []
+            texture_ba2s = []
+            for f in all_ba2s:
+                if 'texture' in f.name.lower():
+                    texture_ba2s.append(f)
+                else:
+                    main_ba2s.append(f)
             
             self.logger.info(f"Found {len(main_ba2s)} main BA2s and {len(texture_ba2s)} texture BA2s")
             
@@ -2373,6 +3048,7 @@ class BA2Handler:
                     [self.archive2_path, str(ba2_file), f"-e={general_path}"],
                     capture_output=True,
                     text=True,
+                    creationflags=_CREATE_NO_WINDOW,
                     timeout=300
                 )
                 extract_time = time.time() - extract_start
@@ -2396,6 +3072,7 @@ class BA2Handler:
                     [self.archive2_path, str(ba2_file), f"-e={textures_path}"],
                     capture_output=True,
                     text=True,
+                    creationflags=_CREATE_NO_WINDOW,
                     timeout=600
                 )
                 extract_time = time.time() - extract_start
@@ -2411,15 +3088,18 @@ class BA2Handler:
             sounds_dir = temp_path / "Sounds"
             sounds_dir.mkdir()
             sound_extensions = {".xwm", ".wav", ".fuz"}
-            has_sounds = False
             
-            for f in general_path.rglob("*"):
-                if f.is_file() and f.suffix.lower() in sound_extensions:
-                    rel = f.relative_to(general_path)
-                    dest = sounds_dir / rel
-                    dest.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.move(str(f), str(dest))
-                    has_sounds = True
+            # Relative paths by slicing off the general_path prefix (no relative_to per file)
+            general_prefix_len = len(os.fspath(general_path)) + 1
+            sound_moves = [(f, os.path.join(sounds_dir, os.fspath(f)[general_prefix_len:]))
+                           for f in general_path.rglob("*")
+                           if f.is_file() and f.suffix.lower() in sound_extensions]
+            # Create each destination folder once rather than once per file
+            for dest_dir in {os.path.dirname(dest) for _, dest in sound_moves}:
+                os.makedirs(dest_dir, exist_ok=True)
+            for f, dest in sound_moves:
+                shutil.move(str(f), dest)
+            has_sounds = bool(sound_moves)
             
             if has_sounds:
                 sound_file_count = sum(1 for _ in sounds_dir.rglob("*") if _.is_file())
@@ -2431,8 +3111,9 @@ class BA2Handler:
             merged_texture_paths = []
             if main_ba2s:
                 merged_main_path = data_path / f"{output_name} - Main.ba2"
-                file_count = sum(1 for _ in general_path.rglob("*") if _.is_file())
-                uncompressed_size = sum(f.stat().st_size for f in general_path.rglob("*") if f.is_file())
+                general_sizes = [size for _, size in _iter_file_sizes(general_path)]
+                file_count = len(general_sizes)
+                uncompressed_size = sum(general_sizes)
                 self.logger.info(f"Creating {merged_main_path.name} ({file_count} files, {uncompressed_size / (1024**2):.2f} MB uncompressed)...")
                 
                 import time
@@ -2441,6 +3122,7 @@ class BA2Handler:
                     [self.archive2_path, str(general_path), f"-c={merged_main_path}", "-f=General", f"-r={general_path}"],
                     capture_output=True,
                     text=True,
+                    creationflags=_CREATE_NO_WINDOW,
                     timeout=600
                 )
                 pack_time = time.time() - pack_start
@@ -2455,8 +3137,9 @@ class BA2Handler:
             # Pack Sounds BA2 (Uncompressed)
             if has_sounds:
                 merged_sounds_path = data_path / f"{output_name} - Sounds.ba2"
-                sound_file_count = sum(1 for _ in sounds_dir.rglob("*") if _.is_file())
-                uncompressed_size = sum(f.stat().st_size for f in sounds_dir.rglob("*") if f.is_file())
+                sound_sizes = [size for _, size in _iter_file_sizes(sounds_dir)]
+                sound_file_count = len(sound_sizes)
+                uncompressed_size = sum(sound_sizes)
                 self.logger.info(f"Creating {merged_sounds_path.name} ({sound_file_count} files, {uncompressed_size / (1024**2):.2f} MB uncompressed)...")
                 
                 import time
@@ -2469,6 +3152,7 @@ class BA2Handler:
                      f"-r={sounds_dir}"],
                     capture_output=True,
                     text=True,
+                    creationflags=_CREATE_NO_WINDOW,
                     timeout=600
                 )
                 pack_time = time.time() - pack_start
@@ -2482,8 +3166,8 @@ class BA2Handler:
             
             # Pack texture BA2s (with 4GB split)
             if texture_ba2s:
-                texture_file_count = sum(1 for item in textures_path.rglob("*") if item.is_file())
-                texture_files = [(item, item.stat().st_size) for item in textures_path.rglob("*") if item.is_file()]
+                texture_files = list(_iter_file_sizes(textures_path))
+                texture_file_count = len(texture_files)
                 texture_files.sort(key=lambda x: x[1], reverse=True)
                 
                 # Split at 7GB uncompressed (targets ~3.5GB compressed)
@@ -2491,12 +3175,14 @@ class BA2Handler:
                 self.logger.info(f"Using {MAX_UNCOMPRESSED_SIZE / (1024**3):.1f}GB uncompressed threshold (targets ~3.5GB compressed)")
                 
                 archive_groups = []
+                group_sizes = []
                 current_group = []
                 current_size = 0
                 
                 for file_path, file_size in texture_files:
                     if current_size + file_size > MAX_UNCOMPRESSED_SIZE and current_group:
                         archive_groups.append(current_group)
+                        group_sizes.append(current_size)
                         current_group = []
                         current_size = 0
                     current_group.append(file_path)
@@ -2504,6 +3190,7 @@ class BA2Handler:
                 
                 if current_group:
                     archive_groups.append(current_group)
+                    group_sizes.append(current_size)
                 
                 total_uncompressed = sum(size for _, size in texture_files)
                 self.logger.info(f"Total uncompressed texture data: {total_uncompressed / (1024**3):.2f}GB")
@@ -2517,16 +3204,18 @@ class BA2Handler:
                         archive_name = f"{output_name} - Textures{idx}.ba2"
                     
                     merged_textures_path = data_path / archive_name
-                    group_uncompressed = sum(f.stat().st_size for f in file_group)
+                    group_uncompressed = group_sizes[idx - 1]
                     self.logger.info(f"Creating {archive_name} with {len(file_group)} files ({group_uncompressed / (1024**3):.2f}GB uncompressed)...")
                     
                     split_temp = temp_path / f"textures_split{idx}"
                     split_temp.mkdir(exist_ok=True)
                     
-                    for file_path in file_group:
-                        rel_path = file_path.relative_to(textures_path)
-                        dest_path = split_temp / rel_path
-                        dest_path.parent.mkdir(parents=True, exist_ok=True)
+                    textures_prefix_len = len(os.fspath(textures_path)) + 1
+                    copy_pairs = [(file_path, os.path.join(split_temp, file_path[textures_prefix_len:]))
+                                  for file_path in file_group]
+                    for dest_dir in {os.path.dirname(dest_path) for _, dest_path in copy_pairs}:
+                        os.makedirs(dest_dir, exist_ok=True)
+                    for file_path, dest_path in copy_pairs:
                         shutil.copy2(file_path, dest_path)
                     
                     pack_start = time.time()
@@ -2534,6 +3223,7 @@ class BA2Handler:
                         [self.archive2_path, str(split_temp), f"-c={merged_textures_path}", "-f=DDS", f"-r={split_temp}"],
                         capture_output=True,
                         text=True,
+                        creationflags=_CREATE_NO_WINDOW,
                         timeout=600
                     )
                     pack_time = time.time() - pack_start
@@ -2615,6 +3305,7 @@ class BA2Handler:
                 - removed_merged: list of removed merged files
                 - error: error message (if failed)
         """
+        self._invalidate_counts()
         backup = Path(backup_path)
         data_path = Path(fo4_path) / "Data"
         
@@ -2628,7 +3319,7 @@ class BA2Handler:
             self.logger.info(f"Restoring CC BA2s from backup: {backup_path}")
             
             # 1. Find all BA2 files in backup
-            backup_ba2s = list(backup.glob("cc*.ba2"))
+            backup_ba2s = self._list_ba2_files(backup, "cc")
             if not backup_ba2s:
                 return {"success": False, "error": "No CC BA2 files found in backup"}
             
@@ -2713,9 +3404,16 @@ class BA2Handler:
         merged_files = []
         
         if mod_folder.exists():
-            # Check for BA2 and ESL files in the mod folder
-            for pattern in ["*.ba2", "*.esl"]:
-                merged_files.extend([f.name for f in mod_folder.glob(pattern)])
+            # Check for BA2 and ESL files in the mod folder (one listing, BA2s first)
+            esl_names = []
+            with os.scandir(mod_folder) as it:
+                for entry in it:
+                    ext = entry.name[-4:].lower()
+                    if ext == _BA2_SUFFIX:
+                        merged_files.append(entry.name)
+                    elif ext == ".esl":
+                        esl_names.append(entry.name)
+            merged_files.extend(esl_names)
         
         # OLD CODE (commented out - kept for reference in case we need fallback to Fallout4.ini method):
         # Check for merged files in Data folder (old location)
@@ -2726,14 +3424,14 @@ class BA2Handler:
         is_merged = len(merged_files) > 0
         
         # Count individual CC BA2s in Data folder
-        cc_ba2_count = len(list(data_path.glob("cc*.ba2")))
+        cc_ba2_count = len(self._list_ba2_files(data_path, "cc"))
         
         # Find available backups
         available_backups = []
         if backup_root.exists():
             for backup_folder in backup_root.iterdir():
                 if backup_folder.is_dir():
-                    cc_count = len(list(backup_folder.glob("cc*.ba2")))
+                    cc_count = len(self._list_ba2_files(backup_folder, "cc"))
                     available_backups.append({
                         "path": str(backup_folder),
                         "name": backup_folder.name,
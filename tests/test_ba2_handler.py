@@ -0,0 +1,164 @@
+"""Tests for BA2Handler: Fallout4.ccc batch enable, stat-keyed caches and BA2 restore"""
+
+import os
+
+import pytest
+
+from ba2_manager.core.ba2_handler import BA2Handler
+
+
+@pytest.fixture
+def layout(tmp_path, monkeypatch):
+    """Minimal MO2 + Fallout 4 layout; runs in tmp_path so config/tracking files land there"""
+    monkeypatch.chdir(tmp_path)
+    mods = tmp_path / "MO2" / "mods"
+    profile = tmp_path / "MO2" / "profiles" / "Default"
+    data = tmp_path / "FO4" / "Data"
+    for folder in (mods / "ModA", mods / "ModB", profile, data):
+        folder.mkdir(parents=True)
+    (mods / "ModA" / "ModA - Main.ba2").write_bytes(b"a")
+    (mods / "ModB" / "ModB - Textures.ba2").write_bytes(b"b")
+    (profile / "modlist.txt").write_text("+ModB\n+ModA\n")
+    (profile / "plugins.txt").write_text("")
+    return {"mods": mods, "profile": profile, "fo4": tmp_path / "FO4", "data": data}
+
+
+@pytest.fixture
+def handler(layout):
+    return BA2Handler(mo2_dir=str(layout["mods"]), log_file="ba2-manager.log")
+
+
+def _bump_mtime(path):
+    """Move path's mtime forward so the change is visible on coarse-timestamp filesystems"""
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_enable_cc_contents_appends_found_plugins(layout, handler):
+    for name in ("ccAAA-one.esl", "ccBBB-two.esm", "ccCCC-three.esp"):
+        (layout["data"] / name).write_bytes(b"")
+    ccc_path = layout["fo4"] / "Fallout4.ccc"
+    # Written without a trailing newline, as write_ccc_file leaves it
+    ccc_path.write_text("ccAAA-one.esl")
+
+    result = handler.enable_cc_contents(["ccaaa-one", "ccMissing", "ccbbb-two", "CCCCC-THREE"],
+                                        str(layout["fo4"]))
+
+    # The missing plugin fails the call, the others are still added; the
+    # already active one is not duplicated and the separator newline is added
+    assert result is False
+    assert ccc_path.read_text() == "ccAAA-one.esl\nccBBB-two.esm\nccCCC-three.esp"
+
+
+def test_enable_cc_contents_skips_duplicates_within_batch(layout, handler):
+    (layout["data"] / "ccAAA-one.esl").write_bytes(b"")
+    ccc_path = layout["fo4"] / "Fallout4.ccc"
+
+    assert handler.enable_cc_contents(["ccaaa-one", "CCAAA-ONE"], str(layout["fo4"])) is True
+    assert ccc_path.read_text() == "ccAAA-one.esl"
+    # Enabling again leaves the file as it is
+    assert handler.enable_cc_content("ccaaa-one", str(layout["fo4"])) is True
+    assert ccc_path.read_text() == "ccAAA-one.esl"
+
+
+def test_active_mods_cache_follows_modlist_changes(layout, handler, monkeypatch):
+    reads = []
+    read_active_mods = handler._read_active_mods
+    monkeypatch.setattr(handler, "_read_active_mods",
+                        lambda *args: reads.append(1) or read_active_mods(*args))
+
+    assert handler._get_active_mods() == ["ModA", "ModB"]
+    assert handler._get_active_mods() == ["ModA", "ModB"]
+    assert len(reads) == 1
+
+    modlist = layout["profile"] / "modlist.txt"
+    modlist.write_text("-ModB\n+ModA\n")
+    _bump_mtime(modlist)
+    assert handler._get_active_mods() == ["ModA"]
+    assert handler._get_active_mods_set() == frozenset({"moda"})
+    assert len(reads) == 2
+
+
+def test_active_mods_cache_dropped_on_register(layout, handler):
+    assert handler._get_active_mods() == ["ModA", "ModB"]
+    (layout["mods"] / "CCMerged").mkdir()
+
+    handler._register_mo2_mod("CCMerged", "CCMerged.esl")
+    assert handler._get_active_mods()[0] == "CCMerged"
+
+    handler._unregister_mo2_mod("CCMerged", "CCMerged.esl")
+    assert "CCMerged" not in handler._get_active_mods()
+
+
+def test_count_cache_reused_until_mod_folder_changes(layout, handler, monkeypatch):
+    scans = []
+    scan_mod_ba2s = handler._scan_mod_ba2s
+    monkeypatch.setattr(handler, "_scan_mod_ba2s",
+                        lambda *args, **kwargs: scans.append(1) or scan_mod_ba2s(*args, **kwargs))
+    fo4 = str(layout["fo4"])
+
+    first = handler.count_ba2_files(fo4)
+    assert (first["mod_main"], first["mod_textures"]) == (1, 1)
+    assert handler.count_ba2_files(fo4)["mod_main"] == 1
+    assert len(scans) == 1
+
+    # A new archive changes the mod folder's mtime, which is part of the key
+    mod_folder = layout["mods"] / "ModA"
+    (mod_folder / "ModA - Textures.ba2").write_bytes(b"t")
+    _bump_mtime(mod_folder)
+    assert handler.count_ba2_files(fo4)["mod_textures"] == 2
+    assert len(scans) == 2
+
+
+def test_count_cache_dropped_by_invalidate(layout, handler, monkeypatch):
+    scans = []
+    scan_mod_ba2s = handler._scan_mod_ba2s
+    monkeypatch.setattr(handler, "_scan_mod_ba2s",
+                        lambda *args, **kwargs: scans.append(1) or scan_mod_ba2s(*args, **kwargs))
+    fo4 = str(layout["fo4"])
+
+    handler.count_ba2_files(fo4)
+    handler._invalidate_counts()
+    handler.count_ba2_files(fo4)
+    assert len(scans) == 2
+
+
+def test_count_cache_follows_profile_switch(layout, handler):
+    # A second profile whose files match Default's in mtime and size, so only
+    # the selected profile's paths tell the two cache keys apart
+    other = layout["profile"].parent / "Other"
+    other.mkdir()
+    (other / "modlist.txt").write_text("-ModB\n+ModA\n")
+    (other / "plugins.txt").write_text("")
+    for name in ("modlist.txt", "plugins.txt"):
+        st = os.stat(layout["profile"] / name)
+        os.utime(other / name, ns=(st.st_atime_ns, st.st_mtime_ns))
+    ini = layout["mods"].parent / "ModOrganizer.ini"
+    fo4 = str(layout["fo4"])
+
+    ini.write_text("[General]\nselected_profile=Default\n")
+    assert handler.count_ba2_files(fo4)["mod_textures"] == 1
+
+    ini.write_text("[General]\nselected_profile=Other\n")
+    assert handler.count_ba2_files(fo4)["mod_textures"] == 0
+
+
+def test_restore_mod_ba2_keeps_backup_when_mod_has_extra_ba2s(layout, handler):
+    mod_folder = layout["mods"] / "ModA"
+    backup = layout["mods"].parent / "BA2_Manager_Backups" / "ModA"
+    backup.mkdir(parents=True)
+    (mod_folder / "ModA - Main.ba2").rename(backup / "ModA - Main.ba2")
+    (mod_folder / "loose.nif").write_bytes(b"n")
+    (mod_folder / "ModA - Extra.ba2").write_bytes(b"x")
+
+    assert handler.restore_mod_ba2("ModA", "main") is True
+    # The mod folder has a BA2 the backup doesn't know about, so it doesn't
+    # match the backup and nothing is cleaned up
+    assert (mod_folder / "ModA - Main.ba2").read_bytes() == b"a"
+    assert (mod_folder / "loose.nif").exists()
+    assert (backup / "ModA - Main.ba2").exists()
+
+    (mod_folder / "ModA - Extra.ba2").unlink()
+    assert handler.restore_mod_ba2("ModA", "main") is True
+    assert not (mod_folder / "loose.nif").exists()
+    assert not backup.exists()